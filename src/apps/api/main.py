@@ -4,6 +4,7 @@ REST API Application
 관리/운영용 REST API (상태 조회, 승인, 헬스체크)
 """
 
+import asyncio
 import logging
 import os
 import signal
@@ -13,10 +14,10 @@ from contextlib import asynccontextmanager
 from logging import getLogger
 from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
 
 from configs.app_config import load_config
 from src.agents.agent_registry import agent_registry
@@ -576,6 +577,16 @@ async def initialize_stream_manager():
     logger.debug("[MAIN] 스트림 매니저가 초기화되었습니다.")
 
 
+async def initialize_event_loop():
+    """이벤트 루프 태스크 팩토리 설정 (Python 3.12+에서 eager task factory 사용)"""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        logger.debug("[MAIN] eager_task_factory 미지원 Python 버전 - 기본 태스크 팩토리 사용")
+        return
+    asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    logger.debug("[MAIN] eager_task_factory가 설정되었습니다.")
+
+
 async def initialize_mcp_service():
     """MCP 서비스 초기화"""
     try:
@@ -593,10 +604,39 @@ async def initialize_mcp_service():
         logger.warning(f"[MAIN] MCP 서비스 초기화 실패: {e}")
 
 
+async def initialize_chat_warmup():
+    """채팅 의도 분석기 및 에이전트 정보 캐시 워밍업"""
+    from .routers.chat.chat_generator import warmup_chat_generator
+
+    active_agent_code = get_active_agent_code()
+    if active_agent_code in _AGENT_REGISTRY:
+        agent_codes = [active_agent_code]
+    else:
+        agent_codes = list(_AGENT_REGISTRY.keys())
+    await warmup_chat_generator(agent_codes)
+    logger.debug("[MAIN] 채팅 워밍업이 완료되었습니다.")
+
+
 async def shutdown_services():
     """서비스 종료"""
     logger.info("[MAIN] 애플리케이션 종료 중...")
 
+    # 진행 중인 채팅 후처리(STM/메모리 저장)는 LLM/DB 종료 전에 마무리
+    try:
+        from .routers.chat.chat_generator import drain_background_tasks
+        await drain_background_tasks()
+        logger.debug("[MAIN] 채팅 백그라운드 후처리가 완료되었습니다.")
+    except Exception as e:
+        logger.error(f"[MAIN] 채팅 백그라운드 후처리 대기 중 오류: {e}")
+
+    # 채팅 DB 전용 스레드 풀 종료 (백그라운드 후처리 완료 후)
+    try:
+        from .routers.chat.db_executor import shutdown_db_executor
+        shutdown_db_executor()
+        logger.debug("[MAIN] 채팅 DB 스레드 풀이 종료되었습니다.")
+    except Exception as e:
+        logger.error(f"[MAIN] 채팅 DB 스레드 풀 종료 중 오류: {e}")
+
     try:
         await llm_manager.close()
         logger.debug("[MAIN] LLM 매니저가 종료되었습니다.")
@@ -640,6 +680,9 @@ async def lifespan(app: FastAPI):
     logger.info("[MAIN] 애플리케이션 시작...")
     logging.getLogger("mysql.connector").setLevel(logging.WARNING)
 
+    # 이벤트 루프 설정 (이후 생성되는 태스크부터 적용)
+    await initialize_event_loop()
+
     # 설정 로드
     config = load_config()
 
@@ -666,6 +709,9 @@ async def lifespan(app: FastAPI):
     await initialize_stream_manager()
     await initialize_mcp_service()
 
+    # 첫 요청 지연을 줄이기 위한 워밍업 (시작을 막지 않도록 백그라운드 실행, 참조 유지)
+    app.state.chat_warmup_task = asyncio.create_task(initialize_chat_warmup())
+
     yield
 
     # 종료
@@ -793,6 +839,19 @@ from src.apps.api.routers.api_key_router import api_key_router
 app.include_router(api_key_router)
 
 
+# 전역 예외 핸들러: 라우터별 try/except 대신 한 곳에서 로깅 후 500 응답
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """처리되지 않은 예외를 로깅하고 내부 정보 없이 500 응답 반환"""
+    logger.error(
+        f"[MAIN] 처리되지 않은 예외: {request.method} {request.url.path} - {exc}",
+        exc_info=exc,
+    )
+    return JSONResponse(
+        status_code=500, content={"detail": "서버 내부 오류가 발생했습니다."}
+    )
+
+
 # ============================================================================
 # LexAI 전용 Swagger 문서 앱
 # ============================================================================
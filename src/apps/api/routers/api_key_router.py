@@ -4,12 +4,13 @@ API Key 관리 라우터
 API Key 발급, 조회, 관리 등을 위한 관리 API
 """
 
+import hashlib
 from datetime import datetime
 from logging import getLogger
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_database_session
@@ -18,16 +19,25 @@ from src.database.services.api_key_service import api_key_service
 
 logger = getLogger("api_key_router")
 
+# OpenAPI 응답 정의 (모듈 로드 시 한 번만 생성)
+_COMMON_RESPONSES = {
+    401: {"description": "인증 실패"},
+    403: {"description": "권한 없음"},
+    404: {"description": "API Key를 찾을 수 없습니다"},
+    500: {"description": "서버 내부 오류"},
+}
+_NO_CONTENT_RESPONSES = {
+    204: {"description": "처리 완료 (return_body=false, 본문 없음)"},
+}
+_NOT_MODIFIED_RESPONSES = {
+    304: {"description": "변경 없음 (If-None-Match 일치)"},
+}
+
 # API Key 관리 라우터
 api_key_router = APIRouter(
     prefix="/api/v1/api-keys",
     tags=["API Key 관리"],
-    responses={
-        401: {"description": "인증 실패"},
-        403: {"description": "권한 없음"},
-        404: {"description": "API Key를 찾을 수 없습니다"},
-        500: {"description": "서버 내부 오류"},
-    },
+    responses=_COMMON_RESPONSES,
 )
 
 
@@ -47,16 +57,30 @@ class APIKeyCreateRequest(BaseModel):
 class APIKeyResponse(BaseModel):
     """API Key 응답"""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: Optional[str]
     is_active: bool
     expires_at: Optional[datetime]
     last_used_at: Optional[datetime]
     created_at: datetime
-    agent_codes: List[str] = Field(default_factory=list)
+    agent_codes: List[str] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("agent_codes", "agent_permissions"),
+    )
 
-    class Config:
-        from_attributes = True
+    @field_validator("agent_codes", mode="before")
+    @classmethod
+    def _permissions_to_agent_codes(cls, value):
+        """ORM의 agent_permissions 관계를 Agent 코드 목록으로 변환"""
+        codes = []
+        for item in value or ():
+            if isinstance(item, str):
+                codes.append(item)
+            elif item.agent:
+                codes.append(item.agent.code)
+        return codes
 
 
 class APIKeyCreateResponse(BaseModel):
@@ -73,8 +97,25 @@ class APIKeyListResponse(BaseModel):
     keys: List[APIKeyResponse]
 
 
+def _make_etag(*parts) -> str:
+    """버전 정보로부터 ETag 생성"""
+    raw = ":".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (
+        tag.strip() for tag in if_none_match.split(",")
+    )
+
+
 @api_key_router.post(
     "/",
+    operation_id="create_api_key",
     response_model=APIKeyCreateResponse,
     status_code=status.HTTP_201_CREATED,
     summary="API Key 생성",
@@ -94,359 +135,281 @@ async def create_api_key(
     Returns:
         APIKeyCreateResponse: 생성된 API Key 정보
     """
-    try:
-        plain_key, api_key_obj = api_key_service.create_api_key(
-            db=db,
-            name=request.name,
-            expires_in_days=request.expires_in_days,
-            agent_codes=request.agent_codes,
-        )
-
-        if not plain_key or not api_key_obj:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="API Key 생성에 실패했습니다.",
-            )
-
-        # Agent 코드 목록 조회
-        db.refresh(api_key_obj, ["agent_permissions"])
-        agent_codes = [
-            perm.agent.code for perm in api_key_obj.agent_permissions if perm.agent
-        ]
-
-        return APIKeyCreateResponse(
-            api_key=plain_key,
-            key_info=APIKeyResponse(
-                id=api_key_obj.id,
-                name=api_key_obj.name,
-                is_active=api_key_obj.is_active,
-                expires_at=api_key_obj.expires_at,
-                last_used_at=api_key_obj.last_used_at,
-                created_at=api_key_obj.created_at,
-                agent_codes=agent_codes,
-            ),
-        )
+    plain_key, api_key_obj = api_key_service.create_api_key(
+        db=db,
+        name=request.name,
+        expires_in_days=request.expires_in_days,
+        agent_codes=request.agent_codes,
+    )
 
-    except Exception as e:
-        logger.error(f"[API_KEY_ROUTER] API Key 생성 실패: {e}", exc_info=True)
+    if not plain_key or not api_key_obj:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"API Key 생성 중 오류가 발생했습니다: {str(e)}",
+            detail="API Key 생성에 실패했습니다.",
         )
 
+    # Agent 코드 목록 조회
+    db.refresh(api_key_obj, ["agent_permissions"])
+
+    return APIKeyCreateResponse(
+        api_key=plain_key,
+        key_info=APIKeyResponse.model_validate(api_key_obj),
+    )
+
 
 @api_key_router.get(
     "/",
+    operation_id="list_api_keys",
     response_model=APIKeyListResponse,
     summary="API Key 목록 조회",
     description="등록된 API Key 목록을 조회합니다.",
+    responses=_NOT_MODIFIED_RESPONSES,
 )
 async def list_api_keys(
+    request: Request,
+    response: Response,
     include_inactive: bool = False,
     agent_code: Optional[str] = None,
     db: Session = Depends(get_database_session),
-) -> APIKeyListResponse:
+) -> Union[APIKeyListResponse, Response]:
     """
     API Key 목록 조회
 
     Args:
+        request: FastAPI Request 객체 (If-None-Match 확인용)
+        response: ETag 헤더 설정용 응답 객체
         include_inactive: 비활성화된 키 포함 여부
         agent_code: 특정 Agent에 대한 권한이 있는 키만 조회
         db: 데이터베이스 세션
 
     Returns:
-        APIKeyListResponse: API Key 목록
+        APIKeyListResponse: API Key 목록 (변경이 없으면 304 응답)
     """
-    try:
-        keys = api_key_service.list_keys(
-            db=db, include_inactive=include_inactive, agent_code=agent_code
-        )
+    # 응답 컬럼과 권한 Agent 코드만 조회하는 쿼리 한 번으로 ETag 계산 후 변경이 없으면 본문 생성 생략
+    version = api_key_service.get_list_version(
+        db=db, include_inactive=include_inactive, agent_code=agent_code
+    )
+    if version is not None:
+        etag = _make_etag(include_inactive, agent_code, *version)
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+
+    keys = api_key_service.list_keys(
+        db=db, include_inactive=include_inactive, agent_code=agent_code
+    )
 
-        key_responses = []
-        for key in keys:
-            # Agent 코드 목록 조회
-            db.refresh(key, ["agent_permissions"])
-            agent_codes = [
-                perm.agent.code for perm in key.agent_permissions if perm.agent
-            ]
-
-            key_responses.append(
-                APIKeyResponse(
-                    id=key.id,
-                    name=key.name,
-                    is_active=key.is_active,
-                    expires_at=key.expires_at,
-                    last_used_at=key.last_used_at,
-                    created_at=key.created_at,
-                    agent_codes=agent_codes,
-                )
-            )
-
-        return APIKeyListResponse(total=len(key_responses), keys=key_responses)
-
-    except Exception as e:
-        logger.error(f"[API_KEY_ROUTER] API Key 목록 조회 실패: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"API Key 목록 조회 중 오류가 발생했습니다: {str(e)}",
-        )
+    key_responses = []
+    for key in keys:
+        # Agent 코드 목록 조회
+        db.refresh(key, ["agent_permissions"])
+        key_responses.append(APIKeyResponse.model_validate(key))
+
+    return APIKeyListResponse(total=len(key_responses), keys=key_responses)
 
 
 @api_key_router.get(
     "/{key_id}",
+    operation_id="get_api_key",
     response_model=APIKeyResponse,
     summary="API Key 상세 조회",
     description="특정 API Key의 상세 정보를 조회합니다.",
+    responses=_NOT_MODIFIED_RESPONSES,
 )
 async def get_api_key(
     key_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_database_session),
-) -> APIKeyResponse:
+) -> Union[APIKeyResponse, Response]:
     """
     API Key 상세 조회
 
     Args:
         key_id: API Key ID
+        request: FastAPI Request 객체 (If-None-Match 확인용)
+        response: ETag 헤더 설정용 응답 객체
         db: 데이터베이스 세션
 
     Returns:
-        APIKeyResponse: API Key 정보
+        APIKeyResponse: API Key 정보 (변경이 없으면 304 응답)
     """
-    try:
-        from src.database.models import APIKey
+    # 관계 로드 없이 응답 컬럼과 권한 Agent 코드만 조회하여 ETag 비교
+    version = api_key_service.get_key_version(db=db, key_id=key_id)
+    if version:
+        etag = _make_etag(key_id, *version)
+        if _etag_matches(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        response.headers["ETag"] = etag
 
-        api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
+    api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
 
-        if not api_key:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
-            )
-
-        # Agent 코드 목록 조회
-        db.refresh(api_key, ["agent_permissions"])
-        agent_codes = [
-            perm.agent.code for perm in api_key.agent_permissions if perm.agent
-        ]
-
-        return APIKeyResponse(
-            id=api_key.id,
-            name=api_key.name,
-            is_active=api_key.is_active,
-            expires_at=api_key.expires_at,
-            last_used_at=api_key.last_used_at,
-            created_at=api_key.created_at,
-            agent_codes=agent_codes,
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"[API_KEY_ROUTER] API Key 조회 실패: {e}", exc_info=True)
+    if not api_key:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"API Key 조회 중 오류가 발생했습니다: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
         )
 
+    # Agent 코드 목록 조회
+    db.refresh(api_key, ["agent_permissions"])
+
+    return APIKeyResponse.model_validate(api_key)
+
 
 @api_key_router.post(
     "/{key_id}/deactivate",
+    operation_id="deactivate_api_key",
     response_model=APIKeyResponse,
     summary="API Key 비활성화",
     description="API Key를 비활성화합니다.",
+    responses=_NO_CONTENT_RESPONSES,
 )
 async def deactivate_api_key(
     key_id: int,
+    return_body: bool = Query(False, description="true이면 갱신된 API Key 정보를 반환"),
     db: Session = Depends(get_database_session),
-) -> APIKeyResponse:
+) -> Union[APIKeyResponse, Response]:
     """
     API Key 비활성화
 
     Args:
         key_id: API Key ID
+        return_body: 응답 본문 반환 여부 (False면 204 No Content)
         db: 데이터베이스 세션
 
     Returns:
-        APIKeyResponse: 비활성화된 API Key 정보
+        APIKeyResponse: 비활성화된 API Key 정보 (return_body=False면 204 응답)
     """
-    try:
-        from src.database.models import APIKey
-
-        api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
-
-        if not api_key:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
-            )
-
-        success = api_key_service.deactivate_key(db=db, key_id=key_id)
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="API Key 비활성화에 실패했습니다.",
-            )
-
-        # 최신 정보 조회
-        db.refresh(api_key, ["agent_permissions"])
-        agent_codes = [
-            perm.agent.code for perm in api_key.agent_permissions if perm.agent
-        ]
-
-        return APIKeyResponse(
-            id=api_key.id,
-            name=api_key.name,
-            is_active=api_key.is_active,
-            expires_at=api_key.expires_at,
-            last_used_at=api_key.last_used_at,
-            created_at=api_key.created_at,
-            agent_codes=agent_codes,
+    api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
+
+    if not api_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"[API_KEY_ROUTER] API Key 비활성화 실패: {e}", exc_info=True)
+    success = api_key_service.deactivate_key(db=db, key_id=key_id)
+
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"API Key 비활성화 중 오류가 발생했습니다: {str(e)}",
+            detail="API Key 비활성화에 실패했습니다.",
         )
 
+    # 본문이 필요 없으면 refresh/직렬화 생략
+    if not return_body:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # 최신 정보 조회
+    db.refresh(api_key, ["agent_permissions"])
+
+    return APIKeyResponse.model_validate(api_key)
+
 
 @api_key_router.post(
     "/{key_id}/agent-permissions",
+    operation_id="add_agent_permission",
     response_model=APIKeyResponse,
     summary="Agent 권한 추가",
     description="API Key에 Agent 접근 권한을 추가합니다.",
+    responses=_NO_CONTENT_RESPONSES,
 )
 async def add_agent_permission(
     key_id: int,
     agent_code: str,
+    return_body: bool = Query(False, description="true이면 갱신된 API Key 정보를 반환"),
     db: Session = Depends(get_database_session),
-) -> APIKeyResponse:
+) -> Union[APIKeyResponse, Response]:
     """
     Agent 권한 추가
 
     Args:
         key_id: API Key ID
         agent_code: Agent 코드
+        return_body: 응답 본문 반환 여부 (False면 204 No Content)
         db: 데이터베이스 세션
 
     Returns:
-        APIKeyResponse: 업데이트된 API Key 정보
+        APIKeyResponse: 업데이트된 API Key 정보 (return_body=False면 204 응답)
     """
-    try:
-        from src.database.models import APIKey
-
-        api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
+    api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
 
-        if not api_key:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
-            )
-
-        success = api_key_service.add_agent_permission(
-            db=db, api_key_id=key_id, agent_code=agent_code
+    if not api_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
         )
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Agent 권한 추가에 실패했습니다: {agent_code}",
-            )
-
-        # 최신 정보 조회
-        db.refresh(api_key, ["agent_permissions"])
-        agent_codes = [
-            perm.agent.code for perm in api_key.agent_permissions if perm.agent
-        ]
-
-        return APIKeyResponse(
-            id=api_key.id,
-            name=api_key.name,
-            is_active=api_key.is_active,
-            expires_at=api_key.expires_at,
-            last_used_at=api_key.last_used_at,
-            created_at=api_key.created_at,
-            agent_codes=agent_codes,
-        )
+    success = api_key_service.add_agent_permission(
+        db=db, api_key_id=key_id, agent_code=agent_code
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"[API_KEY_ROUTER] Agent 권한 추가 실패: {e}", exc_info=True)
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Agent 권한 추가 중 오류가 발생했습니다: {str(e)}",
+            detail=f"Agent 권한 추가에 실패했습니다: {agent_code}",
         )
 
+    # 본문이 필요 없으면 refresh/직렬화 생략
+    if not return_body:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # 최신 정보 조회
+    db.refresh(api_key, ["agent_permissions"])
+
+    return APIKeyResponse.model_validate(api_key)
+
 
 @api_key_router.delete(
     "/{key_id}/agent-permissions/{agent_code}",
+    operation_id="remove_agent_permission",
     response_model=APIKeyResponse,
     summary="Agent 권한 제거",
     description="API Key에서 Agent 접근 권한을 제거합니다.",
+    responses=_NO_CONTENT_RESPONSES,
 )
 async def remove_agent_permission(
     key_id: int,
     agent_code: str,
+    return_body: bool = Query(False, description="true이면 갱신된 API Key 정보를 반환"),
     db: Session = Depends(get_database_session),
-) -> APIKeyResponse:
+) -> Union[APIKeyResponse, Response]:
     """
     Agent 권한 제거
 
     Args:
         key_id: API Key ID
         agent_code: Agent 코드
+        return_body: 응답 본문 반환 여부 (False면 204 No Content)
         db: 데이터베이스 세션
 
     Returns:
-        APIKeyResponse: 업데이트된 API Key 정보
+        APIKeyResponse: 업데이트된 API Key 정보 (return_body=False면 204 응답)
     """
-    try:
-        from src.database.models import APIKey
+    api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
 
-        api_key = db.query(APIKey).filter(APIKey.id == key_id).first()
-
-        if not api_key:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
-            )
-
-        success = api_key_service.remove_agent_permission(
-            db=db, api_key_id=key_id, agent_code=agent_code
+    if not api_key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"API Key (ID: {key_id})를 찾을 수 없습니다.",
         )
 
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Agent 권한 제거에 실패했습니다: {agent_code}",
-            )
-
-        # 최신 정보 조회
-        db.refresh(api_key, ["agent_permissions"])
-        agent_codes = [
-            perm.agent.code for perm in api_key.agent_permissions if perm.agent
-        ]
-
-        return APIKeyResponse(
-            id=api_key.id,
-            name=api_key.name,
-            is_active=api_key.is_active,
-            expires_at=api_key.expires_at,
-            last_used_at=api_key.last_used_at,
-            created_at=api_key.created_at,
-            agent_codes=agent_codes,
-        )
+    success = api_key_service.remove_agent_permission(
+        db=db, api_key_id=key_id, agent_code=agent_code
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"[API_KEY_ROUTER] Agent 권한 제거 실패: {e}", exc_info=True)
+    if not success:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Agent 권한 제거 중 오류가 발생했습니다: {str(e)}",
+            detail=f"Agent 권한 제거에 실패했습니다: {agent_code}",
         )
+
+    # 본문이 필요 없으면 refresh/직렬화 생략
+    if not return_body:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    # 최신 정보 조회
+    db.refresh(api_key, ["agent_permissions"])
+
+    return APIKeyResponse.model_validate(api_key)
+
@@ -5,28 +5,19 @@ Base Router for Expert Agents Service
 """
 
 from logging import getLogger
-from typing import Any, Dict
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 logger = getLogger("base")
 
 # 기본 라우터
 base_router = APIRouter(tags=["Base"])
 
-
-@base_router.get("/health")
-async def health_check() -> Dict[str, str]:
-    """헬스체크 엔드포인트"""
-    logger.info("[HEALTH] Health check requested")
-    return {"status": "healthy", "service": "expert-agents"}
-
-
-@base_router.get("/status")
-async def get_status() -> Dict[str, Any]:
-    """서비스 상태 조회"""
-    logger.info("[STATUS] Status check requested")
-    return {
+# 로드밸런서 프로브가 빈번하게 호출하므로 고정 응답 본문은 미리 직렬화
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "expert-agents"})
+_STATUS_BODY = orjson.dumps(
+    {
         "status": "running",
         "version": "0.1.0",
         "components": {
@@ -36,3 +27,16 @@ async def get_status() -> Dict[str, Any]:
             "chat": "active",
         },
     }
+)
+
+
+@base_router.get("/health")
+async def health_check() -> Response:
+    """헬스체크 엔드포인트"""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+@base_router.get("/status")
+async def get_status() -> Response:
+    """서비스 상태 조회"""
+    return Response(content=_STATUS_BODY, media_type="application/json")
@@ -5,21 +5,41 @@ Chat Response Generator for Expert Agent Service
 """
 
 import asyncio
+import os
 from logging import getLogger
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
 from langchain_core.messages import AIMessage, HumanMessage
 from sqlalchemy.orm import Session
 
 from src.agents.components.caia.caia_discussion_intent_analyzer import (
     CAIADiscussionIntent,
+    CAIADiscussionQueryAnalyzer,
 )
-from src.database.services import chat_channel_service, chat_message_service
-from src.memory.memory_manager import memory_manager
+from src.agents.components.common.user_context_builder import UserContextBuilder
+from src.agents.discussion_agent import DiscussionAgent
+from src.agents.nodes.caia.caia_chat_message_node import CAIAChatMessageNode
+from src.agents.nodes.caia.caia_lgenie_sync_node import CAIALGenieSyncNode
+from src.agents.nodes.caia.caia_memory_node import CAIAMemoryNode
+from src.agents.nodes.caia.caia_stm_message_node import CAIASTMMessageNode
+from src.agents.services.agent_intent_service import AgentIntentService
+from src.apps.api.utils.ttl_cache import TTLCache
+from src.database.connection.connection import get_session_local
+from src.database.services import (
+    chat_channel_service,
+    chat_message_service,
+    database_service,
+)
+from src.memory.memory_manager import initialize_memory_manager, memory_manager
+from src.orchestration.common.agent_interface import orchestration_registry
 from src.orchestration.states.caia_state import CAIAAgentState
 
 from src.schemas.sse_response import AgentStatus, SSEResponse, MessageResponse
+from src.utils.config_utils import ConfigUtils
 from src.utils.log_collector import collector
+from src.utils.timezone_utils import get_current_time_in_timezone
+from .db_executor import run_db
+from .id_resolver import get_cached_user_identity, get_user_identity
 from .stream_manager import stream_manager
 from src.schemas.raih_exceptions import (
     RAIHBusinessException,
@@ -29,10 +49,355 @@ from src.schemas.raih_exceptions import (
 
 logger = getLogger("chat")
 
+# 요청과 무관하게 항상 동일한 SSE 프레임 캐시 (최초 1회만 직렬화)
+_INIT_FRAMES: Dict[str, str] = {}
+# 코드에 고정된 오류 메시지 (SSE 프레임 캐시 대상, 예외에서 온 메시지는 매번 새로 직렬화)
+_ERROR_ORCHESTRATOR_NOT_READY = "오케스트레이터가 초기화되지 않았습니다."
+_ERROR_WORKFLOW_NOT_READY = "워크플로우가 초기화되지 않았습니다."
+_ERROR_WORKFLOW_TIMEOUT = "워크플로우 실행이 시간 초과되었습니다."
+_ERROR_DISCUSSION_TIMEOUT = "토론 실행이 시간 초과되었습니다."
+_FIXED_ERROR_MESSAGES = frozenset(
+    {
+        _ERROR_ORCHESTRATOR_NOT_READY,
+        _ERROR_WORKFLOW_NOT_READY,
+        _ERROR_WORKFLOW_TIMEOUT,
+        _ERROR_DISCUSSION_TIMEOUT,
+    }
+)
+# 고정 오류 메시지별 SSE 프레임 캐시 (키가 위 상수로 제한되므로 크기 제한 불필요)
+_ERROR_FRAMES: Dict[str, str] = {}
+
+# 에이전트 정보 캐시 (agent_code -> (agent_id, agent_name))
+_AGENT_INFO_CACHE_TTL_SECONDS = 300.0
+_AGENT_INFO_CACHE_MAXSIZE = 256
+_agent_info_cache: TTLCache[str, tuple[int, str]] = TTLCache(
+    _AGENT_INFO_CACHE_TTL_SECONDS, _AGENT_INFO_CACHE_MAXSIZE
+)
+
+
+# 의도 분석기 캐시 (분석기는 호출마다 입력을 인자로 받는 무상태 객체이므로 재사용)
+_analyzer_cache: Dict[str, Any] = {}
+
+
+def _get_discussion_analyzer() -> CAIADiscussionQueryAnalyzer:
+    """CAIA 토론 의도 분석기 조회 (최초 1회 생성)"""
+    analyzer = _analyzer_cache.get("caia_discussion")
+    if analyzer is None:
+        analyzer = _analyzer_cache["caia_discussion"] = CAIADiscussionQueryAnalyzer()
+    return analyzer
+
+
+def _get_intent_service(agent_code: str) -> AgentIntentService:
+    """에이전트별 의도 분석 서비스 조회 (agent_code별 최초 1회 생성)"""
+    cache_key = f"intent:{agent_code}"
+    intent_service = _analyzer_cache.get(cache_key)
+    if intent_service is None:
+        intent_service = _analyzer_cache[cache_key] = AgentIntentService(agent_code)
+    return intent_service
+
+
+# 토론 후처리 노드 (무상태 객체이므로 최초 사용 시 1회 생성 후 재사용)
+_post_processing_nodes: Optional[Dict[str, Any]] = None
+
+
+# 실행 중인 백그라운드 태스크 (GC로 인한 태스크 소실 방지용 참조 유지)
+_background_tasks: Set[asyncio.Task] = set()
+# 동시에 실행되는 후처리(STM/메모리 저장 등) 최대 개수 (초과분은 대기)
+_BACKGROUND_TASK_CONCURRENCY = 32
+_background_semaphore = asyncio.Semaphore(_BACKGROUND_TASK_CONCURRENCY)
+# 앱 종료 대기 중 여부 (대기 시작 후에는 새 백그라운드 태스크를 받지 않음)
+_draining_background_tasks = False
+
+
+async def _run_background(coro, after: Optional[asyncio.Task] = None) -> None:
+    """동시 실행 수 제한 하에 백그라운드 코루틴 실행 (실패는 로그만 남김)"""
+    if after is not None:
+        # 선행 태스크 완료까지 대기 (동시 실행 슬롯을 점유하지 않음, 선행 태스크 실패와 무관하게 진행)
+        await asyncio.wait({after})
+    async with _background_semaphore:
+        try:
+            await coro
+        except Exception as e:
+            logger.error(f"[CHAT_GENERATOR] 백그라운드 작업 실패: {e}")
+
+
+def _spawn_background_task(
+    coro, after: Optional[asyncio.Task] = None
+) -> Optional[asyncio.Task]:
+    """
+    코루틴을 백그라운드 태스크로 실행하고 완료 시까지 참조를 유지
+
+    after가 주어지면 해당 태스크가 끝난 뒤 실행합니다.
+    앱 종료 대기가 시작된 뒤에는 코루틴을 실행하지 않고 None을 반환합니다.
+    """
+    if _draining_background_tasks:
+        coro.close()
+        logger.warning("[CHAT_GENERATOR] 앱 종료 중이므로 백그라운드 작업을 건너뜁니다")
+        return None
+    task = asyncio.create_task(_run_background(coro, after))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def drain_background_tasks(timeout: float = 30.0) -> None:
+    """
+    남아 있는 백그라운드 후처리 태스크 완료 대기 (앱 종료 시 호출)
+
+    대기 시작 후에는 새 태스크를 받지 않으며, 남은 태스크가 없어지거나 timeout이 지날 때까지
+    반복해서 대기합니다. timeout 안에 끝나지 않은 태스크는 취소합니다.
+    """
+    global _draining_background_tasks
+    _draining_background_tasks = True
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    pending = {task for task in _background_tasks if not task.done()}
+    while pending:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        logger.info(
+            f"[CHAT_GENERATOR] 백그라운드 후처리 {len(pending)}개 완료 대기 중..."
+        )
+        await asyncio.wait(pending, timeout=remaining)
+        pending = {task for task in _background_tasks if not task.done()}
+
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+        logger.warning(
+            f"[CHAT_GENERATOR] 종료 시간 초과로 백그라운드 후처리 {len(pending)}개를 취소했습니다"
+        )
+
+
+def _agent_id_from_state(state: Dict[str, Any]) -> int:
+    """state에서 에이전트 ID 조회 (후처리 노드 공용)"""
+    return state.get("agent_id", 1)
+
+
+def _get_post_processing_nodes() -> Dict[str, Any]:
+    """
+    토론 후처리 노드 조회
+
+    노드가 memory_manager 초기화 이후의 상태를 참조하도록 import 시점이 아닌 최초 사용 시 생성합니다.
+    """
+    global _post_processing_nodes
+    if _post_processing_nodes is None:
+        _post_processing_nodes = {
+            "stm": CAIASTMMessageNode(
+                memory_manager=memory_manager,
+                logger=logger,
+                get_agent_id=_agent_id_from_state,
+            ),
+            "chat_message": CAIAChatMessageNode(
+                logger=logger,
+                get_agent_id=_agent_id_from_state,
+            ),
+            "lgenie_sync": CAIALGenieSyncNode(logger=logger),
+            "memory": CAIAMemoryNode(
+                memory_manager=memory_manager,
+                logger=logger,
+                get_agent_id=_agent_id_from_state,
+            ),
+        }
+    return _post_processing_nodes
+
+
+# 채팅 타임아웃(초) 캐시 (설정은 런타임에 다시 로드되지 않으므로 최초 사용 시 1회만 조회)
+_chat_timeout: Optional[float] = None
+
+
+def _get_chat_timeout() -> float:
+    """채팅 타임아웃 조회 (최초 1회만 설정에서 읽음)"""
+    global _chat_timeout
+    if _chat_timeout is None:
+        _chat_timeout = ConfigUtils.get_chat_timeout()
+    return _chat_timeout
+
+
+# 완료 응답에 collector 로그(debug_info)를 포함할지 여부 (운영 환경에서는 비활성화)
+_DEBUG_INFO_ENABLED = os.getenv("CHAT_DEBUG_INFO", "false").lower() == "true"
+
+# 최종 답변에 덧붙이는 추천 토론 주제 블록
+_TOPIC_SUGGESTIONS_HEADING = "### 추천 토론 주제"
+_TOPIC_SUGGESTIONS_BLOCK_PREFIX = f"\n\n{_TOPIC_SUGGESTIONS_HEADING}\n"
+
+# 최종 답변 스트리밍 시 한 프레임에 담는 문자 수 (문자 단위 프레임 + sleep 대신 청크 단위 전송)
+_FINAL_ANSWER_CHUNK_SIZE = 16
+
+# 워크플로우 SSE 프레임 묶음 전송 기준 (최대 바이트 수 / 첫 프레임 이후 최대 대기 시간)
+_COALESCE_MAX_BYTES = 4096
+_COALESCE_MAX_DELAY_SECONDS = 0.02
+# 클라이언트로 나가지 못하고 대기 중인 프레임 최대 개수 (초과 시 워크플로우 생성을 대기시킴)
+_STREAM_BUFFER_MAXSIZE = 64
+# 버퍼가 가득 찬 상태가 이 시간 이상 지속되면 클라이언트가 멈춘 것으로 보고 스트림 종료
+_STREAM_STALL_TIMEOUT_SECONDS = 30.0
+_STREAM_END = object()
+
+# SSE keep-alive: 응답이 길어질 때 프록시가 유휴 연결을 끊지 않도록 주석 프레임 전송
+_SSE_KEEPALIVE_SECONDS = 15.0
+_SSE_KEEPALIVE_FRAME = b": ping\n\n"
+
+
+class _StreamStalledError(RuntimeError):
+    """클라이언트가 스트림을 읽지 않아 전송 버퍼가 비워지지 않을 때 발생합니다."""
+
+
+async def _coalesce(
+    source: AsyncGenerator[Any, None],
+    max_bytes: int = _COALESCE_MAX_BYTES,
+    max_delay: float = _COALESCE_MAX_DELAY_SECONDS,
+    keepalive: float = _SSE_KEEPALIVE_SECONDS,
+) -> AsyncGenerator[Any, None]:
+    """
+    연속으로 생성되는 SSE 프레임을 묶어서 전달합니다.
+
+    SSE 프레임은 빈 줄로 구분되는 독립 레코드이므로 그대로 이어 붙여도 됩니다.
+    str/bytes 프레임 모두 묶으며, 종류가 바뀌면 기존 버퍼를 먼저 전송합니다.
+    버퍼가 max_bytes 이상이 되거나 첫 프레임 이후 max_delay가 지나면 전송합니다.
+    원본 제너레이터는 별도 태스크 하나에서 끝까지 실행되므로
+    내부의 asyncio.timeout 등 태스크 단위 동작은 그대로 유지됩니다.
+    원본이 keepalive 동안 프레임을 만들지 않으면 SSE 주석(ping) 프레임을 전달합니다.
+    대기 큐는 _STREAM_BUFFER_MAXSIZE로 제한되어 클라이언트가 느리게 읽으면
+    원본 제너레이터가 대기하게 됩니다. (느린 클라이언트로 인한 메모리 증가 방지)
+    큐가 _STREAM_STALL_TIMEOUT_SECONDS 동안 가득 차 있으면 원본을 닫고,
+    남은 프레임을 버린 뒤 다음 읽기에서 바로 _StreamStalledError를 발생시킵니다.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_BUFFER_MAXSIZE)
+    # 큐가 가득 찬 상태에서도 소비자에게 전달되도록 큐와 별도로 보관하는 종료 오류
+    stalled: Optional[_StreamStalledError] = None
+
+    async def _pump() -> None:
+        nonlocal stalled
+        try:
+            async for frame in source:
+                # 버퍼에 여유가 있으면 타이머 없이 바로 넣음 (가득 찬 경우에만 제한 시간 대기)
+                try:
+                    queue.put_nowait(frame)
+                    continue
+                except asyncio.QueueFull:
+                    pass
+                try:
+                    async with asyncio.timeout(_STREAM_STALL_TIMEOUT_SECONDS):
+                        await queue.put(frame)
+                except TimeoutError:
+                    # 원본 제너레이터를 먼저 닫아 워크플로우 자원을 해제
+                    await source.aclose()
+                    stalled = _StreamStalledError(
+                        f"{_STREAM_STALL_TIMEOUT_SECONDS}초 동안 전송 버퍼가 비워지지 않았습니다"
+                    )
+                    return
+        except asyncio.CancelledError as e:
+            # 소비자가 종료하면서 이 태스크를 취소한 경우가 아니면 소비자 쪽에서 다시 발생시키도록 전달
+            if asyncio.current_task().cancelling():
+                raise
+            await queue.put(e)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_STREAM_END)
+
+    loop = asyncio.get_running_loop()
+    pump_task = asyncio.create_task(_pump())
+    buffer: List[str | bytes] = []
+    buffered_bytes = 0
+    deadline = 0.0
+    try:
+        while True:
+            if stalled is not None:
+                raise stalled
+            if buffer:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), max(deadline - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    yield buffer[0][:0].join(buffer)
+                    buffer = []
+                    buffered_bytes = 0
+                    continue
+            else:
+                # 버퍼가 비어 있을 때만 keepalive 제한 시간으로 대기 (조용한 구간에 ping 전송)
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    try:
+                        async with asyncio.timeout(keepalive):
+                            item = await queue.get()
+                    except TimeoutError:
+                        yield _SSE_KEEPALIVE_FRAME
+                        continue
+
+            if isinstance(item, (str, bytes)):
+                # str과 bytes는 이어 붙일 수 없으므로 종류가 바뀌면 먼저 전송
+                if buffer and type(item) is not type(buffer[0]):
+                    yield buffer[0][:0].join(buffer)
+                    buffer = []
+                    buffered_bytes = 0
+                if not buffer:
+                    deadline = loop.time() + max_delay
+                buffer.append(item)
+                buffered_bytes += len(item)
+                if buffered_bytes >= max_bytes:
+                    yield buffer[0][:0].join(buffer)
+                    buffer = []
+                    buffered_bytes = 0
+                continue
+
+            # 프레임이 아닌 항목(종료 표시, 예외, 기타 객체)은 버퍼를 먼저 비운 뒤 처리
+            if buffer:
+                yield buffer[0][:0].join(buffer)
+                buffer = []
+                buffered_bytes = 0
+            if item is _STREAM_END:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        if not pump_task.done():
+            pump_task.cancel()
+
+
+def _fetch_discussion_setup(session_id: str) -> Optional[Dict[str, Any]]:
+    """세션의 채팅방에서 가장 최근 토론 설정(message_metadata)을 조회합니다. (동기, DB 전용 스레드 풀에서 실행)"""
+    # 공유 연결 풀의 세션을 사용하고 조회 직후 반환
+    with get_session_local()() as db:
+        channel = chat_channel_service.get_by_session_id(db, session_id)
+        if not channel:
+            logger.warning(
+                f"[CHAT_GENERATOR] 채널을 찾을 수 없음: session_id={session_id}"
+            )
+            return None
+        logger.debug("[CHAT_GENERATOR] 채널 발견: channel_id=%s", channel.id)
+        return chat_message_service.get_latest_discussion_setup(db, channel.id)
+
 
 class ChatResponseGenerator:
     """채팅 응답 생성기 - SSE 스트리밍 처리 (Expert Agents 지원)"""
 
+    # 요청마다 생성되는 객체이므로 인스턴스 __dict__ 대신 슬롯 사용 (모든 속성은 __init__에서 초기화)
+    __slots__ = (
+        "agent_code",
+        "orchestrator",
+        "start_time",
+        "node_index",
+        "total_nodes",
+        "node_start_time",
+        "final_content",
+        "agent_name",
+        "agent_id",
+        "channel_id",
+        "user_message_id",
+        "assistant_message_id",
+        "db",
+        "actual_user_id",
+        "session_id",
+        "_response_handler",
+    )
+
     def __init__(self, agent_code: str):
         self.agent_code = agent_code
         self.orchestrator = None  # generate_response에서 설정됨
@@ -50,8 +415,10 @@ class ChatResponseGenerator:
         self.assistant_message_id: Optional[int] = None
         self.db: Optional[Session] = None
         self.actual_user_id: Optional[str] = None  # 실제 사용자 ID
+        self.session_id: Optional[str] = None  # generate_response에서 설정됨
 
-        # Response handler 캐시
+        # 오케스트레이션 response handler 캐시 (_get_response_handler)
+        # INIT/오류 SSE 프레임은 에이전트와 무관하게 동일하므로 모듈 레벨(_INIT_FRAMES, _ERROR_FRAMES)에서 캐시
         self._response_handler: Optional[Any] = None
 
     async def generate_response(
@@ -66,40 +433,37 @@ class ChatResponseGenerator:
     ) -> AsyncGenerator[str, None]:
         """채팅 응답을 생성하고 SSE로 스트리밍합니다."""
         logger.debug("[CHAT_GENERATOR] generate_response 호출됨")
-        from src.utils.timezone_utils import get_current_time_in_timezone
 
         # 오케스트레이터 설정
         self.orchestrator = orchestrator
         self.session_id = session_id  # session_id 저장
         self.db = db  # 데이터베이스 세션 저장
 
-        # 스트림 연속성 처리
+        # 스트림 상태 등록 (요청마다 새 워크플로우를 실행하며, 이전 응답을 이어서 전송하지 않음)
         if session_id:
-            await self._handle_stream_continuity(session_id, user_id, client_id)
+            self._register_stream(session_id, user_id, client_id)
 
+        # 워크플로우/노드 정보가 없으면 (None 포함) 1로 처리
         try:
-            if (
-                hasattr(orchestrator, "workflow")
-                and orchestrator.workflow
-                and hasattr(orchestrator.workflow, "nodes")
-            ):
-                if orchestrator.workflow.nodes is not None:
-                    self.total_nodes = len(orchestrator.workflow.nodes)
-                else:
-                    self.total_nodes = 1
-            else:
-                self.total_nodes = 1
-        except Exception as e:
-            logger.error(f"Error in total_nodes calculation: {e}")
+            self.total_nodes = len(orchestrator.workflow.nodes) or 1
+        except (AttributeError, TypeError):
             self.total_nodes = 1
 
         self.start_time = get_current_time_in_timezone().timestamp()
 
-        # 에이전트 정보 설정
-        await self._setup_agent_info()
-
-        # 사용자 ID 매핑
-        numeric_user_id, actual_user_id = await self._map_user_id(user_id)
+        # 에이전트 정보와 사용자 ID 매핑은 캐시에 있으면 바로 사용하고,
+        # 없는 것만 DB 전용 스레드 풀에서 동시에 조회 (서로 독립적인 동기 DB 조회, 이벤트 루프 블로킹 방지)
+        lookups = []
+        if not self._load_cached_agent_info():
+            lookups.append(run_db(self._setup_agent_info))
+        user_mapping = get_cached_user_identity(user_id)
+        if user_mapping is None:
+            lookups.append(run_db(self._map_user_id, user_id))
+        if lookups:
+            results = await asyncio.gather(*lookups)
+            if user_mapping is None:
+                user_mapping = results[-1]
+        numeric_user_id, actual_user_id = user_mapping
 
         # 실제 사용자 ID를 인스턴스 변수로 저장
         self.actual_user_id = actual_user_id
@@ -107,19 +471,15 @@ class ChatResponseGenerator:
         # 메시지 상태 준비
         messages = [HumanMessage(content=question)]
 
-        # user context 로드
-        from src.agents.components.common.user_context_builder import UserContextBuilder
-
         # 메모리 매니저 초기화 확인 및 강제 초기화
         if not memory_manager.stm_provider or not memory_manager.provider:
             logger.warning(
                 "[CHAT_GENERATOR] 메모리 매니저가 초기화되지 않았습니다. 강제 초기화를 시도합니다."
             )
-            from src.memory.memory_manager import initialize_memory_manager
-
             initialize_memory_manager()
             logger.debug("[CHAT_GENERATOR] 메모리 매니저 강제 초기화 완료")
 
+        # user context 로드
         context_builder = UserContextBuilder(memory_manager)
         user_context = await context_builder.build_user_context(
             user_id=numeric_user_id,
@@ -164,17 +524,16 @@ class ChatResponseGenerator:
             # 의도 분석 및 워크플로우 실행
             logger.debug("[CHAT_GENERATOR] _process_workflow 호출 시작")
 
+            # 워크플로우 제너레이터는 한 번만 생성하여 스트림 매니저와 공유
+            workflow_stream = _coalesce(self._process_workflow(state=initial_state))
+
             # 스트림 제너레이터 설정
             if self.session_id:
-                await self._set_stream_generator(
-                    self._process_workflow(state=initial_state)
-                )
+                self._set_stream_generator(workflow_stream)
 
-            async for sse_data in self._process_workflow(
-                state=initial_state,
-            ):
+            async for sse_data in workflow_stream:
                 # 스트림 상태 업데이트
-                await self._update_stream_state(current_node="processing")
+                self._update_stream_state(current_node="processing")
                 yield sse_data
 
         except (
@@ -189,15 +548,21 @@ class ChatResponseGenerator:
             yield completion_response
             return
 
-        except asyncio.CancelledError as e:
-            logger.warning("[CHAT_GENERATOR] 워크플로우 실행이 취소되었습니다.")
+        except _StreamStalledError as e:
+            logger.warning(f"[CHAT_GENERATOR] 클라이언트 수신 지연으로 스트림 종료: {e}")
+            # 멈춘 스트림이 재연결 시 재사용되지 않도록 제너레이터 해제
+            self._set_stream_generator(None)
             error_response = await self._create_error_response(e)
             yield error_response
-            # 완료 상태 응답
             completion_response = await self._create_completion_response()
             yield completion_response
             return
 
+        except asyncio.CancelledError:
+            # 취소는 호출자(ASGI 서버)의 취소 처리를 위해 그대로 전파 (끊긴 연결에 프레임을 쓰지 않음)
+            logger.warning("[CHAT_GENERATOR] 워크플로우 실행이 취소되었습니다.")
+            raise
+
         except Exception as e:
             logger.error(f"[CHAT_GENERATOR] 워크플로우 실행 중 오류: {e}")
             error_response = await self._create_error_response(e)
@@ -211,36 +576,52 @@ class ChatResponseGenerator:
         completion_response = await self._create_completion_response()
         yield completion_response
 
-    async def _setup_agent_info(self):
+    def _load_cached_agent_info(self) -> bool:
+        """캐시된 에이전트 정보가 있으면 설정하고 True를 반환합니다."""
+        cached = _agent_info_cache.get(self.agent_code)
+        if cached is None:
+            return False
+        self.agent_id, self.agent_name = cached
+        return True
+
+    def _setup_agent_info(self):
         """에이전트 정보를 설정합니다."""
-        logger.debug(f"[CHAT_ROUTER] agent_code: {self.agent_code}")
+        # 0. 캐시된 에이전트 정보가 있으면 사용 (agent_code별 정보는 배포 중 거의 변하지 않음)
+        if self._load_cached_agent_info():
+            return
+
+        logger.debug("[CHAT_ROUTER] agent_code: %s", self.agent_code)
         logger.debug(
-            f"[CHAT_ROUTER] memory_manager.provider: {memory_manager.provider}"
+            "[CHAT_ROUTER] memory_manager.provider: %s",
+            memory_manager.provider,
         )
         logger.debug(
-            f"[CHAT_ROUTER] memory_manager.provider_type: {memory_manager.provider_type}"
+            "[CHAT_ROUTER] memory_manager.provider_type: %s",
+            memory_manager.provider_type,
         )
 
         # 1. 먼저 memory_manager를 통해 에이전트 정보 조회 시도
         try:
             agent_info = memory_manager.get_agent_info_by_code(self.agent_code)
             logger.debug(
-                f"[CHAT_ROUTER] memory_manager에서 조회한 agent_info: {agent_info}"
+                "[CHAT_ROUTER] memory_manager에서 조회한 agent_info: %s",
+                agent_info,
             )
             if agent_info:
                 self.agent_id = agent_info.get("id", 2)
                 self.agent_name = agent_info.get("name", f"Agent ({self.agent_code})")
                 logger.debug(
-                    f"[CHAT_ROUTER] memory_manager에서 설정 완료 - agent_id: {self.agent_id}, agent_name: {self.agent_name}"
+                    "[CHAT_ROUTER] memory_manager에서 설정 완료 - agent_id: %s, agent_name: %s",
+                    self.agent_id,
+                    self.agent_name,
                 )
+                _agent_info_cache.set(self.agent_code, (self.agent_id, self.agent_name))
                 return
         except Exception as e:
             logger.warning(f"[CHAT_ROUTER] memory_manager 에이전트 정보 조회 실패: {e}")
 
         # 2. memory_manager 실패 시 직접 데이터베이스에서 조회
         try:
-            from src.database.services import database_service
-
             if database_service.is_available():
                 # agents 테이블에서 agent_code로 조회
                 agent_record = database_service.select_one(
@@ -254,7 +635,12 @@ class ChatResponseGenerator:
                     self.agent_id = agent_record["id"]
                     self.agent_name = agent_record["name"]
                     logger.debug(
-                        f"[CHAT_ROUTER] 데이터베이스에서 조회 성공 - agent_id: {self.agent_id}, agent_name: {self.agent_name}"
+                        "[CHAT_ROUTER] 데이터베이스에서 조회 성공 - agent_id: %s, agent_name: %s",
+                        self.agent_id,
+                        self.agent_name,
+                    )
+                    _agent_info_cache.set(
+                        self.agent_code, (self.agent_id, self.agent_name)
                     )
                     return
                 else:
@@ -275,28 +661,32 @@ class ChatResponseGenerator:
 
     async def _create_discussion_init(self):
         """토론 전용 초기 상태 응답을 생성합니다."""
-        return await SSEResponse.create_init_discussion().send()
+        frame = _INIT_FRAMES.get("discussion")
+        if frame is None:
+            frame = await SSEResponse.create_init_discussion().send()
+            _INIT_FRAMES["discussion"] = frame
+        return frame
 
     async def _create_general_init(self):
         """일반 워크플로우용 초기 상태 응답을 생성합니다."""
-        return await SSEResponse.create_init_general().send()
+        frame = _INIT_FRAMES.get("general")
+        if frame is None:
+            frame = await SSEResponse.create_init_general().send()
+            _INIT_FRAMES["general"] = frame
+        return frame
 
     async def _analyze_intent_early(self, state):
         """INIT 전에 의도를 분석합니다."""
         try:
             # CAIA는 새로운 discussion intent analyzer 사용
             if self.agent_code == "caia":
-                from src.agents.components.caia.caia_discussion_intent_analyzer import (
-                    CAIADiscussionQueryAnalyzer,
-                )
-
                 query = state["user_query"]
                 user_context = state.get("user_context", {})
                 chat_history = (
                     user_context.get("recent_messages", []) if user_context else []
                 )
 
-                analyzer = CAIADiscussionQueryAnalyzer()
+                analyzer = _get_discussion_analyzer()
                 analysis_result = await analyzer.analyze_intent(
                     query=query,
                     chat_history=chat_history,
@@ -305,15 +695,11 @@ class ChatResponseGenerator:
                 intent = analysis_result.get("intent")
             else:
                 # 다른 에이전트들은 기존 서비스 사용
-                from src.agents.services.agent_intent_service import AgentIntentService
-
-                intent_service = AgentIntentService(self.agent_code)
+                intent_service = _get_intent_service(self.agent_code)
                 analysis_result = await intent_service.analyze_intent(state)
                 intent = analysis_result.get("intent")
 
-            logger.debug(
-                f"[CHAT_GENERATOR] {self.agent_code} 초기 의도 분류 결과: {intent}"
-            )
+            logger.debug("[CHAT_GENERATOR] %s 초기 의도 분류 결과: %s", self.agent_code, intent)
             collector.log("intent", intent)
 
             return intent
@@ -324,76 +710,31 @@ class ChatResponseGenerator:
                 return CAIADiscussionIntent.NON_DISCUSSABLE.value
             return "general"  # 기본값으로 일반 워크플로우 사용
 
-    async def _map_user_id(self, user_id: str) -> tuple[int, str]:
+    def _map_user_id(self, user_id: str) -> tuple[int, str]:
         """사용자 ID를 숫자 ID와 실제 사용자 ID로 매핑합니다."""
         try:
-            # 먼저 숫자인지 확인
-            numeric_id = int(user_id)
-            # 숫자 ID인 경우 데이터베이스에서 실제 사용자 ID 조회
-            try:
-                from src.database.services import database_service
+            identity = get_user_identity(user_id)
+        except Exception as e:
+            logger.error(f"[CHAT] 사용자 ID 매핑 실패: {e}, Unknown 사용")
+            identity = None
 
-                if database_service.is_available():
-                    user_record = database_service.select_one(
-                        "users", "user_id", "id = %s", (numeric_id,)
-                    )
-                    if user_record:
-                        actual_user_id = user_record["user_id"]
-                        logger.debug(
-                            f"[CHAT] 사용자 ID 매핑: {numeric_id} -> {actual_user_id}"
-                        )
-                        return numeric_id, actual_user_id
-                    else:
-                        logger.warning(
-                            f"[CHAT] 사용자를 찾을 수 없음: {numeric_id}, Unknown 사용"
-                        )
-                        return numeric_id, "Unknown"
-                else:
-                    logger.warning(
-                        f"[CHAT] 데이터베이스 서비스 사용 불가, Unknown 사용"
-                    )
-                    return numeric_id, "Unknown"
-            except Exception as e:
-                logger.error(f"[CHAT] 사용자 ID 조회 실패: {e}, Unknown 사용")
-                return numeric_id, "Unknown"
-        except ValueError:
-            # 문자열인 경우 데이터베이스에서 ID 조회
-            try:
-                from src.database.services import database_service
+        if identity is not None:
+            logger.debug("[CHAT] 사용자 ID 매핑: %s -> %s", user_id, identity)
+            return identity
 
-                if database_service.is_available():
-                    user_record = database_service.select_one(
-                        "users", "id, user_id", "user_id = %s", (user_id,)
-                    )
-                    if user_record:
-                        numeric_user_id = user_record["id"]
-                        actual_user_id = user_record["user_id"]
-                        logger.debug(
-                            f"[CHAT] 사용자 ID 매핑: {user_id} -> {numeric_user_id} ({actual_user_id})"
-                        )
-                        return numeric_user_id, actual_user_id
-                    else:
-                        logger.warning(
-                            f"[CHAT] 사용자를 찾을 수 없음: {user_id}, Unknown 사용"
-                        )
-                        return 1, "Unknown"
-                else:
-                    logger.warning(
-                        f"[CHAT] 데이터베이스 서비스 사용 불가, Unknown 사용"
-                    )
-                    return 1, "Unknown"
-            except Exception as e:
-                logger.error(f"[CHAT] 사용자 ID 매핑 실패: {e}, Unknown 사용")
-                return 1, "Unknown"
+        logger.warning(f"[CHAT] 사용자를 찾을 수 없음: {user_id}, Unknown 사용")
+        # 숫자 ID는 그대로 사용하고, 알 수 없는 로그인 ID는 기본 사용자(1)로 대체
+        try:
+            return int(user_id), "Unknown"
+        except ValueError:
+            return 1, "Unknown"
 
     async def _process_workflow(self, state):
         """워크플로우를 처리합니다."""
         # 이미 분석된 의도 사용
         intent = state.get("intent", "general")
 
-        logger.debug(
-            f"[CHAT_GENERATOR] {self.agent_code} 워크플로우 처리 - 의도: {intent}"
-        )
+        logger.debug("[CHAT_GENERATOR] %s 워크플로우 처리 - 의도: %s", self.agent_code, intent)
 
         # CAIA는 그래프 워크플로우에서 의도 분석 및 라우팅을 처리
         # discussion 의도는 SSE 스트리밍을 위해 별도 처리
@@ -422,19 +763,20 @@ class ChatResponseGenerator:
                     yield sse_data
         else:
             # 다른 에이전트들은 기존 로직 유지
-            from src.agents.services.agent_intent_service import AgentIntentService
-
-            intent_service = AgentIntentService(self.agent_code)
+            intent_service = _get_intent_service(self.agent_code)
 
             if intent_service.is_special_intent(intent):
                 logger.debug(
-                    f"[CHAT_GENERATOR] {self.agent_code} 특수 의도 감지 - 특수 워크플로우 호출"
+                    "[CHAT_GENERATOR] %s 특수 의도 감지 - 특수 워크플로우 호출",
+                    self.agent_code,
                 )
                 async for sse_data in self._handle_special_workflow(state, intent):
                     yield sse_data
             else:
                 logger.debug(
-                    f"[CHAT_GENERATOR] {self.agent_code} {intent} 의도 - 일반 워크플로우 호출"
+                    "[CHAT_GENERATOR] %s %s 의도 - 일반 워크플로우 호출",
+                    self.agent_code,
+                    intent,
                 )
                 async for sse_data in self._handle_general_workflow(state):
                     yield sse_data
@@ -464,8 +806,6 @@ class ChatResponseGenerator:
         """토론 에이전트를 직접 호출하여 각 노드에서 실시간 스트리밍합니다."""
         logger.debug("[CHAT_GENERATOR] _handle_discussion_agent 호출됨")
         try:
-            from src.agents.discussion_agent import DiscussionAgent
-
             # state에 topic과 speakers가 없으면 DB에서 직접 조회 (Redis는 휘발성이므로 DB를 우선)
             if not state.get("topic") or not state.get("speakers"):
                 logger.info(
@@ -475,74 +815,32 @@ class ChatResponseGenerator:
                 found = False
                 # DB에서 직접 조회 (같은 session_id의 chat_messages 테이블에서 가장 최근 토론 설정 찾기)
                 try:
-                    from src.database.connection import get_db
-                    from src.database.services import (
-                        chat_channel_service,
-                        chat_message_service,
-                    )
-
                     session_id = state.get("session_id")
-                    agent_id = state.get("agent_id", 1)
                     user_id = state.get("user_id")
 
                     if session_id and user_id:
                         logger.info(
                             f"[CHAT_GENERATOR] DB에서 토론 설정 조회 시작: session_id={session_id}, user_id={user_id}"
                         )
-                        db = next(get_db())
-                        try:
-                            # 채널 조회
-                            channel = chat_channel_service.get_by_session_id(
-                                db, session_id
+                        # 동기 DB 조회는 DB 전용 스레드 풀에서 실행하여 이벤트 루프 블로킹 방지
+                        metadata = await run_db(
+                            _fetch_discussion_setup, session_id
+                        )
+                        if metadata:
+                            topic = metadata["topic"]
+                            speakers = metadata["speakers"]
+                            logger.info(
+                                f"[CHAT_GENERATOR] DB에서 topic과 speakers 발견 (최신 메시지): topic={topic}, speakers={len(speakers)}명"
                             )
-                            if channel:
-                                logger.debug(
-                                    f"[CHAT_GENERATOR] 채널 발견: channel_id={channel.id}"
+                            state["topic"] = topic
+                            state["speakers"] = speakers
+                            if "discussion_rules" in metadata:
+                                state["discussion_rules"] = metadata.get(
+                                    "discussion_rules", []
                                 )
-                                # 최근 메시지 조회 (최대 100개, created_at 내림차순으로 이미 정렬됨)
-                                # 충분히 많은 메시지를 조회하여 토론 설정 메시지를 찾음
-                                messages = chat_message_service.get_recent_messages(
-                                    db, channel.id, limit=100
-                                )
-                                logger.debug(
-                                    f"[CHAT_GENERATOR] 최근 메시지 {len(messages)}개 조회됨"
-                                )
-
-                                # 최신 메시지부터 검색 (이미 created_at 내림차순으로 정렬됨)
-                                # message_metadata에 topic과 speakers가 있는 가장 최근 메시지 찾기
-                                for i, msg in enumerate(messages):
-                                    if hasattr(msg, "message_metadata"):
-                                        metadata = msg.message_metadata
-                                        if isinstance(metadata, dict):
-                                            topic = metadata.get("topic")
-                                            speakers = metadata.get("speakers")
-                                            logger.debug(
-                                                f"[CHAT_GENERATOR] DB 메시지[{i}] (최신순) metadata 확인: topic={topic}, speakers={speakers if speakers else None}"
-                                            )
-                                            if topic and speakers:
-                                                logger.info(
-                                                    f"[CHAT_GENERATOR] DB에서 topic과 speakers 발견 (최신 메시지): topic={topic}, speakers={len(speakers)}명"
-                                                )
-                                                state["topic"] = topic
-                                                state["speakers"] = speakers
-                                                if "discussion_rules" in metadata:
-                                                    state["discussion_rules"] = (
-                                                        metadata.get(
-                                                            "discussion_rules", []
-                                                        )
-                                                    )
-                                                if "tools" in metadata:
-                                                    state["tools"] = metadata.get(
-                                                        "tools"
-                                                    )
-                                                found = True
-                                                break
-                            else:
-                                logger.warning(
-                                    f"[CHAT_GENERATOR] 채널을 찾을 수 없음: session_id={session_id}"
-                                )
-                        finally:
-                            db.close()
+                            if "tools" in metadata:
+                                state["tools"] = metadata.get("tools")
+                            found = True
                     else:
                         logger.warning(
                             f"[CHAT_GENERATOR] session_id 또는 user_id가 없음: session_id={session_id}, user_id={user_id}"
@@ -564,25 +862,11 @@ class ChatResponseGenerator:
             # 토론 에이전트의 각 노드를 순차적으로 실행하며 실시간 스트리밍
             logger.debug("[CHAT_GENERATOR] discussion_agent.run_discussion 호출 시작")
 
-            # 토론 실행 및 응답 수집
-            discussion_content = ""
-            discussion_script = []
+            # 토론 실행 (후처리는 state["script"] 기준이므로 SSE 프레임은 그대로 전달만 함)
             async for sse_data in self._run_discussion_and_collect_content(
                 discussion_agent, state
             ):
                 yield sse_data
-                # SSE 데이터에서 토론 내용 추출
-                if "data:" in sse_data and '"token"' in sse_data:
-                    try:
-                        import json
-
-                        data_part = sse_data.split("data: ")[1].strip()
-                        if data_part:
-                            parsed_data = json.loads(data_part)
-                            if "token" in parsed_data:
-                                discussion_content += parsed_data["token"]
-                    except:
-                        pass  # 파싱 실패 시 무시
 
             # 토론 완료 후 스크립트를 상태에 저장
             discussion_script = state.get("script", [])
@@ -602,22 +886,13 @@ class ChatResponseGenerator:
                 f"[CHAT_GENERATOR] 토론 스크립트를 state에 저장했습니다: {len(discussion_script)}개 발언"
             )
 
-            # 토론 완료 후 후처리
-            await self._handle_discussion_post_processing(state, discussion_content)
+            # 토론 완료 후 후처리 (클라이언트 응답과 무관하므로 백그라운드에서 실행)
+            _spawn_background_task(self._handle_discussion_post_processing(state))
 
         except asyncio.CancelledError as e:
-            logger.warning(
-                f"[CHAT_GENERATOR] 토론 에이전트 실행이 취소되었습니다. - {str(e)}"
-            )
-            logger.warning(
-                f"[CHAT_GENERATOR] CancelledError 상세 정보: {type(e).__name__}"
-            )
-            import traceback
-
-            logger.warning(f"[CHAT_GENERATOR] 스택 트레이스: {traceback.format_exc()}")
-            # CancelledError는 정상적인 취소이므로 에러 응답 대신 완료 응답
-            yield await self._create_completion_response()
-            return
+            # 클라이언트 연결 해제 등 예상된 종료이므로 스택 트레이스 없이 한 줄만 기록 후 전파
+            logger.debug("[CHAT_GENERATOR] 토론 에이전트 실행이 취소되었습니다. - %s", e)
+            raise
         except Exception as e:
             logger.error(f"[CHAT_GENERATOR] 토론 에이전트 호출 실패: {e}")
             yield await self._create_error_response(e)
@@ -626,46 +901,34 @@ class ChatResponseGenerator:
         """토론을 실행합니다."""
         try:
             # 토론 실행에 타임아웃 설정 (설정에서 가져오기)
-            from src.utils.config_utils import ConfigUtils
-
-            async with asyncio.timeout(ConfigUtils.get_chat_timeout()):
+            async with asyncio.timeout(_get_chat_timeout()):
                 async for sse_data in discussion_agent.run_discussion(state):
                     yield sse_data
         except asyncio.TimeoutError:
             logger.warning("[CHAT_GENERATOR] 토론 실행 타임아웃 발생")
-            yield await self._create_error_response("토론 실행이 시간 초과되었습니다.")
+            yield await self._create_error_response(_ERROR_DISCUSSION_TIMEOUT)
         except asyncio.CancelledError as e:
             logger.warning(
                 f"[CHAT_GENERATOR] _run_discussion_and_collect_content에서 CancelledError 발생: {e}"
             )
-            # 취소된 경우 완료 응답으로 처리하여 클라이언트에게 정상 종료 알림
-            yield await self._create_completion_response()
+            raise
         except Exception as e:
             logger.error(
                 f"[CHAT_GENERATOR] _run_discussion_and_collect_content에서 오류 발생: {e}"
             )
             yield await self._create_error_response(e)
 
-    async def _handle_discussion_post_processing(self, state, discussion_content):
+    async def _handle_discussion_post_processing(self, state):
         """토론 완료 후 후처리를 수행합니다."""
         # 토론 스크립트는 State에 이미 저장되어 있음
         # 워크플로우 후처리 노드들을 직접 호출하여 DB 저장 및 동기화 수행
         try:
-            from src.agents.nodes.caia.caia_stm_message_node import CAIASTMMessageNode
-            from src.agents.nodes.caia.caia_chat_message_node import CAIAChatMessageNode
-            from src.agents.nodes.caia.caia_lgenie_sync_node import CAIALGenieSyncNode
-            from src.agents.nodes.caia.caia_memory_node import CAIAMemoryNode
-            from src.memory.memory_manager import memory_manager
-
             # State에 필요한 정보가 있는지 확인
             if not state.get("channel_id"):
                 logger.warning("[CHAT_GENERATOR] channel_id가 없어 후처리를 건너뜁니다")
                 return
 
-            # 1. STM 메시지 저장
-            logger.debug("[CHAT_GENERATOR] 토론 후처리: STM 메시지 저장")
-
-            # STM 저장 전에 script 확인 및 로깅
+            # 후처리 전에 script 확인 및 로깅
             script = state.get("script")
             if script and isinstance(script, list) and len(script) > 0:
                 logger.info(
@@ -676,143 +939,72 @@ class ChatResponseGenerator:
                     f"[CHAT_GENERATOR] 토론 후처리: STM 저장 전 state에 script가 없거나 비어있습니다. script={script}, type={type(script)}"
                 )
 
-            stm_node = CAIASTMMessageNode(
-                memory_manager=memory_manager,
-                logger=logger,
-                get_agent_id=lambda state: state.get("agent_id", 1),
-            )
+            nodes = _get_post_processing_nodes()
 
-            try:
-                result = await stm_node.save_stm_message(state)
+            async def _save_stm():
+                # 1. STM 메시지 저장
+                logger.debug("[CHAT_GENERATOR] 토론 후처리: STM 메시지 저장")
+                result = await nodes["stm"].save_stm_message(state)
                 logger.info(
                     f"[CHAT_GENERATOR] 토론 후처리: STM 메시지 저장 완료. result={result}"
                 )
-            except Exception as e:
-                logger.error(
-                    f"[CHAT_GENERATOR] 토론 후처리: STM 메시지 저장 중 오류 발생: {e}",
-                    exc_info=True,
-                )
 
-            # 2. DB에 채팅 메시지 저장
-            logger.debug("[CHAT_GENERATOR] 토론 후처리: 채팅 메시지 저장")
-            script = state.get("script")
-            if script:
-                logger.info(
-                    f"[CHAT_GENERATOR] 토론 후처리: state에 {len(script) if isinstance(script, list) else 'N/A'}개 발언이 있습니다"
-                )
-            else:
-                logger.warning(
-                    "[CHAT_GENERATOR] 토론 후처리: state에 script가 없습니다"
-                )
-            chat_message_node = CAIAChatMessageNode(
-                logger=logger,
-                get_agent_id=lambda state: state.get("agent_id", 1),
-            )
-            chat_result = await chat_message_node.save_chat_message(state)
-            if chat_result:
-                state.update(chat_result)
-                logger.info(
-                    f"[CHAT_GENERATOR] 토론 후처리: 채팅 메시지 저장 완료 - {len(chat_result.get('saved_message_ids', []))}개 메시지 저장됨"
-                )
-            else:
-                logger.warning(
-                    "[CHAT_GENERATOR] 토론 후처리: 채팅 메시지 저장 결과가 비어있습니다"
-                )
-
-            # 3. LGenie 동기화
-            logger.debug("[CHAT_GENERATOR] 토론 후처리: LGenie 동기화")
-            lgenie_sync_node = CAIALGenieSyncNode(logger=logger)
-            await lgenie_sync_node.sync_lgenie(state)
+            async def _save_chat_and_sync_lgenie():
+                # 2. DB에 채팅 메시지 저장
+                logger.debug("[CHAT_GENERATOR] 토론 후처리: 채팅 메시지 저장")
+                chat_result = await nodes["chat_message"].save_chat_message(state)
+                if chat_result:
+                    state.update(chat_result)
+                    logger.info(
+                        f"[CHAT_GENERATOR] 토론 후처리: 채팅 메시지 저장 완료 - {len(chat_result.get('saved_message_ids', []))}개 메시지 저장됨"
+                    )
+                else:
+                    logger.warning(
+                        "[CHAT_GENERATOR] 토론 후처리: 채팅 메시지 저장 결과가 비어있습니다"
+                    )
 
-            # 4. 메모리 추출 및 저장
-            logger.debug("[CHAT_GENERATOR] 토론 후처리: 메모리 추출 및 저장")
-            memory_node = CAIAMemoryNode(
-                memory_manager=memory_manager,
-                logger=logger,
-                get_agent_id=lambda state: state.get("agent_id", 1),
+                # 3. LGenie 동기화 (저장된 메시지 ID가 필요하므로 채팅 메시지 저장 후 실행)
+                logger.debug("[CHAT_GENERATOR] 토론 후처리: LGenie 동기화")
+                await nodes["lgenie_sync"].sync_lgenie(state)
+
+            async def _extract_memory():
+                # 4. 메모리 추출 및 저장
+                logger.debug("[CHAT_GENERATOR] 토론 후처리: 메모리 추출 및 저장")
+                await nodes["memory"].extract_and_save_memory_new(state)
+
+            # STM 저장, 채팅 메시지 저장(+LGenie 동기화), 메모리 추출은 서로 독립적이므로 동시 실행
+            results = await asyncio.gather(
+                _save_stm(),
+                _save_chat_and_sync_lgenie(),
+                _extract_memory(),
+                return_exceptions=True,
             )
-            await memory_node.extract_and_save_memory_new(state)
+            for step, result in zip(
+                ("STM 메시지 저장", "채팅 메시지 저장/LGenie 동기화", "메모리 추출 및 저장"),
+                results,
+            ):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"[CHAT_GENERATOR] 토론 후처리: {step} 중 오류 발생: {result}",
+                        exc_info=result,
+                    )
 
             logger.info("[CHAT_GENERATOR] 토론 후처리 완료")
 
         except Exception as e:
             logger.error(f"[CHAT_GENERATOR] 토론 후처리 중 오류: {e}")
 
-    async def _save_stm_message(self, state):
-        """STM 메시지를 저장합니다."""
-        try:
-            from src.agents.nodes.caia.caia_stm_message_node import CAIASTMMessageNode
-            from src.memory.memory_manager import memory_manager
-
-            stm_node = CAIASTMMessageNode(
-                memory_manager=memory_manager,
-                logger=logger,
-                get_agent_id=lambda state: state.get("agent_id", 1),
-            )
-            ### 🫡🫡🫡 summarize!!
-            stm_state = {
-                "user_id": state.get("user_id"),
-                "agent_id": self.agent_id,
-                "session_id": state.get("session_id", ""),
-                "user_query": state.get("user_query", ""),
-                "messages": state.get("messages"),
-                "discussion_script": state.get("script", []),  # 토론 스크립트 추가
-                "summarize": state.get("summarize", []),
-            }
-
-            await stm_node.save_stm_message(stm_state)
-
-        except Exception as e:
-            logger.error(f"[CHAT_GENERATOR] STM 메시지 저장 실패: {e}")
-
-    async def _extract_and_save_memory(self, state):
-        """메모리를 추출하고 저장합니다."""
-        try:
-            from src.agents.nodes.caia.caia_memory_node import CAIAMemoryNode
-            from src.memory.memory_manager import memory_manager
-
-            memory_node = CAIAMemoryNode(
-                memory_manager=memory_manager,
-                logger=logger,
-                get_agent_id=lambda state: state.get("agent_id", 1),
-            )
-
-            memory_state = {
-                "user_id": state.get("user_id"),
-                "agent_id": self.agent_id,
-                "session_id": state.get("session_id") or "",
-                "messages": state.get("messages"),
-                "actual_user_id": self.actual_user_id,
-            }
-
-            await memory_node.extract_and_save_memory(memory_state)
-
-        except Exception as e:
-            logger.error(f"[CHAT_GENERATOR] 메모리 추출 및 저장 실패: {e}")
-
     def _get_response_handler(self):
         """에이전트 코드에 맞는 response handler를 레지스트리에서 조회합니다."""
         if self._response_handler is None:
-            from src.orchestration.common.agent_interface import orchestration_registry
-
-            # 오케스트레이션 레지스트리에서 response handler 조회
-            # app.state에서 레지스트리를 가져오거나 전역 레지스트리 사용
-            try:
-                # FastAPI app context에서 레지스트리 가져오기 시도
-                from fastapi import Request
-
-                # Request 객체가 없으면 전역 레지스트리 사용
-                self._response_handler = orchestration_registry.get_response_handler(
-                    self.agent_code
-                )
-            except Exception:
-                # 전역 레지스트리 사용
-                self._response_handler = orchestration_registry.get_response_handler(
-                    self.agent_code
-                )
-
+            # 전역 오케스트레이션 레지스트리에서 response handler 조회 (인스턴스당 1회)
+            self._response_handler = orchestration_registry.get_response_handler(
+                self.agent_code
+            )
             logger.debug(
-                f"[CHAT_GENERATOR] {self.agent_code} 응답 처리기 조회 완료: {type(self._response_handler).__name__}"
+                "[CHAT_GENERATOR] %s 응답 처리기 조회 완료: %s",
+                self.agent_code,
+                type(self._response_handler).__name__,
             )
 
         return self._response_handler
@@ -823,9 +1015,7 @@ class ChatResponseGenerator:
             # 오케스트레이터와 워크플로우 확인
             if self.orchestrator is None:
                 logger.error("[CHAT_GENERATOR] 오케스트레이터가 None입니다.")
-                yield await self._create_error_response(
-                    "오케스트레이터가 초기화되지 않았습니다."
-                )
+                yield await self._create_error_response(_ERROR_ORCHESTRATOR_NOT_READY)
                 return
 
             if (
@@ -833,19 +1023,15 @@ class ChatResponseGenerator:
                 or self.orchestrator.workflow is None
             ):
                 logger.error("[CHAT_GENERATOR] 워크플로우가 초기화되지 않았습니다.")
-                yield await self._create_error_response(
-                    "워크플로우가 초기화되지 않았습니다."
-                )
+                yield await self._create_error_response(_ERROR_WORKFLOW_NOT_READY)
                 return
 
             # Response handler 조회
             response_handler = self._get_response_handler()
 
             # 워크플로우 실행 (타임아웃 설정)
-            from src.utils.config_utils import ConfigUtils
-
             try:
-                async with asyncio.timeout(ConfigUtils.get_chat_timeout()):
+                async with asyncio.timeout(_get_chat_timeout()):
                     # 통합 스트리밍 메서드 사용
                     async for sse_response in self.orchestrator.astream_sse(
                         state, response_handler
@@ -854,14 +1040,12 @@ class ChatResponseGenerator:
 
             except asyncio.TimeoutError:
                 logger.warning("[CHAT_GENERATOR] 워크플로우 실행 타임아웃 발생")
-                yield await self._create_error_response(
-                    "워크플로우 실행이 시간 초과되었습니다."
-                )
+                yield await self._create_error_response(_ERROR_WORKFLOW_TIMEOUT)
                 return
 
         except asyncio.CancelledError:
             logger.warning("[CHAT_GENERATOR] 일반 워크플로우 실행이 취소되었습니다.")
-            yield await self._create_error_response("워크플로우 실행이 취소되었습니다.")
+            raise
 
         except Exception as e:
             logger.error(f"[CHAT_GENERATOR] 워크플로우 실행 실패: {e}")
@@ -912,11 +1096,17 @@ class ChatResponseGenerator:
                 content = final_output.get("content", str(final_output))
 
             # topic_suggestions가 있으면 추가 (discussable_topic_node에서 이미 포맷팅된 경우는 제외)
-            if topic_suggestions and content and "### 추천 토론 주제" not in content:
-                content += "\n\n"
-                content += "### 추천 토론 주제\n"
-                for i, topic in enumerate(topic_suggestions, 1):
-                    content += f"{i}. {topic}\n"
+            if topic_suggestions and content and _TOPIC_SUGGESTIONS_HEADING not in content:
+                content = "".join(
+                    [
+                        content,
+                        _TOPIC_SUGGESTIONS_BLOCK_PREFIX,
+                        *(
+                            f"{i}. {topic}\n"
+                            for i, topic in enumerate(topic_suggestions, 1)
+                        ),
+                    ]
+                )
         else:
             # 단순 문자열인 경우
             content = str(final_output)
@@ -928,19 +1118,19 @@ class ChatResponseGenerator:
                 streaming = sse_metadata.get("streaming", True)
 
                 if streaming:
-                    # 문자 단위 스트리밍
-                    for char in content:
+                    # 청크 단위 스트리밍
+                    for i in range(0, len(content), _FINAL_ANSWER_CHUNK_SIZE):
                         yield await SSEResponse.create_llm(
-                            token=char, done=False
+                            token=content[i : i + _FINAL_ANSWER_CHUNK_SIZE], done=False
                         ).send()
-                        await asyncio.sleep(0.01)
 
             # DB 저장은 워크플로우에서 처리하므로 여기서는 스트리밍만 수행
             # 내용을 토큰 단위로 스트리밍 (sse_metadata가 없거나 streaming이 True인 경우)
             if not (isinstance(final_output, dict) and "sse_metadata" in final_output):
-                for char in content:
-                    yield await SSEResponse.create_llm(token=char, done=False).send()
-                    await asyncio.sleep(0.01)  # 스트리밍 효과
+                for i in range(0, len(content), _FINAL_ANSWER_CHUNK_SIZE):
+                    yield await SSEResponse.create_llm(
+                        token=content[i : i + _FINAL_ANSWER_CHUNK_SIZE], done=False
+                    ).send()
 
             # 최종 완료 응답
             event_data = {}
@@ -974,9 +1164,10 @@ class ChatResponseGenerator:
         else:
             # 내용이 없는 경우
             error_content = "죄송합니다. 응답을 생성할 수 없습니다."
-            for char in error_content:
-                yield await SSEResponse.create_llm(token=char, done=False).send()
-                await asyncio.sleep(0.01)
+            for i in range(0, len(error_content), _FINAL_ANSWER_CHUNK_SIZE):
+                yield await SSEResponse.create_llm(
+                    token=error_content[i : i + _FINAL_ANSWER_CHUNK_SIZE], done=False
+                ).send()
 
             yield await SSEResponse.create_llm(
                 token=error_content,  # 전체 에러 내용을 token에 포함
@@ -1010,29 +1201,26 @@ class ChatResponseGenerator:
     async def _create_error_response(self, error: Exception):
         """오류 응답을 생성합니다."""
         logger.error(f"[CHAT_ROUTER] 오류 발생: {error}")
-        return await SSEResponse.create_error(
-            error_message=f"처리 중 오류가 발생했습니다: {str(error)}"
-        ).send()
+        error_message = f"처리 중 오류가 발생했습니다: {str(error)}"
+        # 예외 메시지는 임의의 값이므로 캐시하지 않고 매번 새로 생성
+        if not isinstance(error, str) or error not in _FIXED_ERROR_MESSAGES:
+            return await SSEResponse.create_error(error_message=error_message).send()
+
+        frame = _ERROR_FRAMES.get(error)
+        if frame is None:
+            frame = await SSEResponse.create_error(error_message=error_message).send()
+            _ERROR_FRAMES[error] = frame
+        return frame
 
     async def _create_completion_response(self):
         """완료 응답을 생성합니다."""
         # chat_id는 session_id를 사용
-        chat_id = getattr(self, "session_id", "")
+        chat_id = self.session_id
         # message_id는 타임스탬프 기반으로 생성
         message_id = f"msg_{self.start_time}" if self.start_time else ""
 
-        # 디버그 정보 수집
-        # collector = getattr(self, "debug_collector", None) # ⚠️ 동작 안함! (항상 None)
-
-        # if collector is None:
-        #     # DebugInfoCollector가 없는 경우 빈 리스트 반환
-        #     debug_info = []
-        # else:
-        #     debug_info = collector.get_logs()
-
-        from src.utils.log_collector import collector
-
-        debug_info = collector.get_logs()
+        # 디버그 정보 수집 (비활성화 시 로그 수집/직렬화 생략)
+        debug_info = collector.get_logs() if _DEBUG_INFO_ENABLED else []
 
         return await SSEResponse.create_close(
             chat_id=chat_id or "",
@@ -1041,61 +1229,23 @@ class ChatResponseGenerator:
             debug_info=debug_info,
         ).send()
 
-    async def _handle_stream_continuity(
+    def _register_stream(
         self, session_id: str, user_id: str, client_id: str | None = None
-    ):
-        """스트림 연속성 처리"""
+    ) -> None:
+        """스트림 상태 생성(또는 재활성화) 및 클라이언트 연결 등록"""
         try:
-            # 기존 스트림 상태 확인
-            existing_stream = stream_manager.get_stream(session_id)
-
-            if existing_stream and existing_stream.is_active:
-                logger.debug(f"[CHAT_GENERATOR] 기존 스트림 발견: {session_id}")
-
-                # 클라이언트 연결 추가
-                if client_id:
-                    stream_manager.add_client_to_stream(session_id, client_id)
-
-                # 기존 스트림이 진행 중인지 확인
-                if existing_stream.stream_generator:
-                    logger.debug(f"[CHAT_GENERATOR] 기존 스트림 재연결: {session_id}")
-                    # 기존 스트림의 상태를 현재 인스턴스에 복사
-                    if existing_stream.current_state:
-                        # 기존 상태에서 이어서 처리
-                        await self._resume_from_existing_state(existing_stream)
-                        return
-
-            # 새 스트림 생성 또는 기존 스트림이 없는 경우
             # actual_user_id가 설정되지 않은 경우 기본값 사용
-            actual_user_id = getattr(self, "actual_user_id", None) or user_id
-            stream_state = stream_manager.create_stream(
-                session_id, self.agent_code, actual_user_id
-            )
+            actual_user_id = self.actual_user_id or user_id
+            stream_manager.create_stream(session_id, self.agent_code, actual_user_id)
             if client_id:
                 stream_manager.add_client_to_stream(session_id, client_id)
 
-            logger.debug(f"[CHAT_GENERATOR] 새 스트림 시작: {session_id}")
+            logger.debug("[CHAT_GENERATOR] 스트림 시작: %s", session_id)
 
         except Exception as e:
-            logger.error(f"[CHAT_GENERATOR] 스트림 연속성 처리 실패: {e}")
+            logger.error(f"[CHAT_GENERATOR] 스트림 상태 등록 실패: {e}")
 
-    async def _resume_from_existing_state(self, stream_state):
-        """기존 상태에서 스트림 재개"""
-        try:
-            logger.debug(
-                f"[CHAT_GENERATOR] 기존 상태에서 재개: {stream_state.current_node}"
-            )
-
-            # 기존 스트림 제너레이터가 있으면 재사용
-            if stream_state.stream_generator:
-                async for chunk in stream_state.stream_generator:
-                    yield chunk
-                return
-
-        except Exception as e:
-            logger.error(f"[CHAT_GENERATOR] 기존 상태 재개 실패: {e}")
-
-    async def _update_stream_state(
+    def _update_stream_state(
         self, current_node: str = None, current_state: Dict[str, Any] = None
     ):
         """스트림 상태 업데이트"""
@@ -1104,7 +1254,26 @@ class ChatResponseGenerator:
                 self.session_id, current_node, current_state
             )
 
-    async def _set_stream_generator(self, generator):
+    def _set_stream_generator(self, generator):
         """스트림 제너레이터 설정"""
         if self.session_id:
             stream_manager.set_stream_generator(self.session_id, generator)
+
+
+async def warmup_chat_generator(agent_codes: List[str]) -> None:
+    """
+    의도 분석기와 에이전트 정보 캐시를 미리 채웁니다. (앱 시작 시 백그라운드 실행)
+
+    첫 채팅 요청이 분석기 생성 및 에이전트 정보 조회 비용을 부담하지 않도록 합니다.
+    """
+    for agent_code in agent_codes:
+        try:
+            if agent_code == "caia":
+                _get_discussion_analyzer()
+            else:
+                _get_intent_service(agent_code)
+            # 에이전트 정보 조회는 동기 DB 호출을 포함하므로 DB 전용 스레드 풀에서 실행
+            await run_db(ChatResponseGenerator(agent_code)._setup_agent_info)
+            logger.debug("[CHAT_GENERATOR] %s 워밍업 완료", agent_code)
+        except Exception as e:
+            logger.warning(f"[CHAT_GENERATOR] {agent_code} 워밍업 실패: {e}")
@@ -4,10 +4,12 @@ Chat Management Router for Expert Agent Service
 채팅 채널 및 메시지 관리 API
 """
 
+import asyncio
 from logging import getLogger
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_database_session
@@ -20,9 +22,29 @@ from .chat_models import (
     ChatChannelWithMessagesResponse,
     ChatMessageResponse,
 )
+from .db_executor import run_db
+from .id_resolver import get_agent_id, get_numeric_user_id
 
 logger = getLogger("chat_management")
 
+# get_chat_channels의 `status` 쿼리 파라미터가 fastapi.status 모듈을 가리므로 상수로 고정
+_HTTP_400 = status.HTTP_400_BAD_REQUEST
+_HTTP_500 = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+# ORM 객체 목록을 응답 모델 목록으로 한 번에 검증 (행마다 생성자 호출 대신 단일 호출)
+_CHANNEL_LIST_ADAPTER = TypeAdapter(List[ChatChannelResponse])
+_MESSAGE_LIST_ADAPTER = TypeAdapter(List[ChatMessageResponse])
+
+
+def _json_response(body: str | bytes) -> Response:
+    """
+    pydantic-core가 직렬화한 JSON 바이트를 그대로 응답으로 반환
+
+    검증이 끝난 응답 모델을 FastAPI가 다시 dict 변환/재검증/인코딩하지 않도록 합니다.
+    (response_model은 OpenAPI 문서용으로 유지)
+    """
+    return Response(content=body, media_type="application/json")
+
 # 채팅 관리 라우터
 chat_management_router = APIRouter(
     prefix="/api/v1/chat",
@@ -103,7 +125,7 @@ async def get_chat_channels(
         None, description="채널 상태 (active, inactive, archived)"
     ),
     db: Session = Depends(get_database_session),
-) -> ChatChannelListResponse:
+) -> Response:
     """
     사용자의 채팅 채널 목록을 조회합니다.
 
@@ -119,16 +141,36 @@ async def get_chat_channels(
         ChatChannelListResponse: 채팅 채널 목록
     """
     try:
-        # 사용자 ID를 숫자 ID로 변환
-        numeric_user_id = await _get_numeric_user_id(db, user_id)
+        # 사용자 ID 변환과 에이전트 ID 조회(agent_code가 제공된 경우)를 동시에 실행
+        # (두 조회 모두 요청 세션이 아닌 별도 세션을 사용하므로 병렬 실행 가능)
+        lookups = [run_db(get_numeric_user_id, user_id)]
+        if agent_code:
+            lookups.append(run_db(get_agent_id, agent_code))
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
-        # 에이전트 ID 조회 (agent_code가 제공된 경우)
+        # 알 수 없는 사용자/에이전트는 채널 목록 조회 전에 거부 (기본 ID로 대체하지 않음)
+        numeric_user_id = results[0]
+        if numeric_user_id is None:
+            raise HTTPException(
+                status_code=_HTTP_400,
+                detail=f"알 수 없는 user_id입니다: {user_id}",
+            )
         agent_id = None
         if agent_code:
-            agent_id = await _get_agent_id(db, agent_code)
+            agent_id = results[1]
+            if agent_id is None:
+                raise HTTPException(
+                    status_code=_HTTP_400,
+                    detail=f"알 수 없는 agent_code입니다: {agent_code}",
+                )
 
         # 채팅 채널 목록 조회
-        channels, total_count = chat_channel_service.get_user_channels(
+        channels, total_count = await run_db(
+            chat_channel_service.get_user_channels,
             db,
             user_id=numeric_user_id,
             agent_id=agent_id,
@@ -138,34 +180,25 @@ async def get_chat_channels(
         )
 
         # 응답 모델로 변환
-        channel_responses = [
-            ChatChannelResponse(
-                id=channel.id,
-                session_id=channel.session_id,
-                user_id=channel.user_id,
-                agent_id=channel.agent_id,
-                title=channel.title,
-                status=channel.status.value,
-                channel_metadata=channel.channel_metadata,
-                last_message_at=channel.last_message_at,
-                message_count=channel.message_count,
-                created_at=channel.created_at,
-                updated_at=channel.updated_at,
-            )
-            for channel in channels
-        ]
+        channel_responses = _CHANNEL_LIST_ADAPTER.validate_python(
+            channels, from_attributes=True
+        )
 
-        return ChatChannelListResponse(
-            channels=channel_responses,
-            total_count=total_count,
-            page=page,
-            page_size=page_size,
+        return _json_response(
+            ChatChannelListResponse(
+                channels=channel_responses,
+                total_count=total_count,
+                page=page,
+                page_size=page_size,
+            ).model_dump_json()
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"[CHAT_MANAGEMENT] 채널 목록 조회 실패: {e}")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status_code=_HTTP_500,
             detail=f"채널 목록 조회 중 오류가 발생했습니다: {str(e)}",
         )
 
@@ -226,7 +259,7 @@ async def get_chat_channel(
     limit: int = Query(100, ge=1, le=500, description="메시지 수 제한"),
     offset: int = Query(0, ge=0, description="메시지 오프셋"),
     db: Session = Depends(get_database_session),
-) -> ChatChannelWithMessagesResponse:
+) -> Response:
     """
     특정 채팅 채널의 상세 정보와 메시지 목록을 조회합니다.
 
@@ -241,53 +274,31 @@ async def get_chat_channel(
         ChatChannelWithMessagesResponse: 채팅 채널 상세 정보
     """
     try:
-        # 채팅 채널 조회
-        channel = chat_channel_service.get_by_session_id(db, session_id)
+        # 채팅 채널과 메시지 목록을 한 번의 쿼리로 조회
+        channel, messages = await run_db(
+            chat_channel_service.get_by_session_id_with_messages,
+            db,
+            session_id,
+            message_type=message_type,
+            limit=limit,
+            offset=offset,
+        )
         if not channel:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="채팅 채널을 찾을 수 없습니다",
             )
 
-        # 메시지 목록 조회
-        messages = chat_message_service.get_channel_messages(
-            db,
-            channel_id=channel.id,
-            message_type=message_type,
-            limit=limit,
-            offset=offset,
+        # 응답 모델로 변환
+        message_responses = _MESSAGE_LIST_ADAPTER.validate_python(
+            messages, from_attributes=True
         )
 
-        # 응답 모델로 변환
-        message_responses = [
-            ChatMessageResponse(
-                id=message.id,
-                channel_id=message.channel_id,
-                agent_id=message.agent_id,
-                message_type=message.message_type.value,
-                content=message.content,
-                message_metadata=message.message_metadata,
-                parent_message_id=message.parent_message_id,
-                is_deleted=message.is_deleted,
-                created_at=message.created_at,
-                updated_at=message.updated_at,
-            )
-            for message in messages
-        ]
-
-        return ChatChannelWithMessagesResponse(
-            id=channel.id,
-            session_id=channel.session_id,
-            user_id=channel.user_id,
-            agent_id=channel.agent_id,
-            title=channel.title,
-            status=channel.status.value,
-            channel_metadata=channel.channel_metadata,
-            last_message_at=channel.last_message_at,
-            message_count=channel.message_count,
-            created_at=channel.created_at,
-            updated_at=channel.updated_at,
-            messages=message_responses,
+        channel_response = ChatChannelResponse.model_validate(channel)
+        return _json_response(
+            ChatChannelWithMessagesResponse(
+                **dict(channel_response), messages=message_responses
+            ).model_dump_json()
         )
 
     except HTTPException:
@@ -342,7 +353,7 @@ async def get_chat_messages(
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(50, ge=1, le=200, description="페이지 크기"),
     db: Session = Depends(get_database_session),
-) -> List[ChatMessageResponse]:
+) -> Response:
     """
     특정 채팅 채널의 메시지 목록을 조회합니다.
 
@@ -358,7 +369,7 @@ async def get_chat_messages(
     """
     try:
         # 채팅 채널 조회
-        channel = chat_channel_service.get_by_session_id(db, session_id)
+        channel = await run_db(chat_channel_service.get_by_session_id, db, session_id)
         if not channel:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -367,7 +378,8 @@ async def get_chat_messages(
 
         # 메시지 목록 조회
         offset = (page - 1) * page_size
-        messages = chat_message_service.get_channel_messages(
+        messages = await run_db(
+            chat_message_service.get_channel_messages,
             db,
             channel_id=channel.id,
             message_type=message_type,
@@ -376,21 +388,10 @@ async def get_chat_messages(
         )
 
         # 응답 모델로 변환
-        return [
-            ChatMessageResponse(
-                id=message.id,
-                channel_id=message.channel_id,
-                agent_id=message.agent_id,
-                message_type=message.message_type.value,
-                content=message.content,
-                message_metadata=message.message_metadata,
-                parent_message_id=message.parent_message_id,
-                is_deleted=message.is_deleted,
-                created_at=message.created_at,
-                updated_at=message.updated_at,
-            )
-            for message in messages
-        ]
+        message_responses = _MESSAGE_LIST_ADAPTER.validate_python(
+            messages, from_attributes=True
+        )
+        return _json_response(_MESSAGE_LIST_ADAPTER.dump_json(message_responses))
 
     except HTTPException:
         raise
@@ -400,43 +401,3 @@ async def get_chat_messages(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"메시지 목록 조회 중 오류가 발생했습니다: {str(e)}",
         )
-
-
-async def _get_numeric_user_id(db: Session, user_id: str) -> int:
-    """사용자 ID를 숫자 ID로 변환합니다."""
-    try:
-        # 먼저 숫자인지 확인
-        numeric_id = int(user_id)
-        return numeric_id
-    except ValueError:
-        # 문자열인 경우 데이터베이스에서 ID 조회
-        try:
-            from src.database.services import database_service
-
-            if database_service.is_available():
-                user_record = database_service.select_one(
-                    "users", "id", "user_id = %s", (user_id,)
-                )
-                if user_record:
-                    return user_record["id"]
-            return 1  # 기본값
-        except Exception as e:
-            logger.error(f"[CHAT_MANAGEMENT] 사용자 ID 조회 실패: {e}")
-            return 1
-
-
-async def _get_agent_id(db: Session, agent_code: str) -> int:
-    """에이전트 코드로 에이전트 ID를 조회합니다."""
-    try:
-        from src.database.services import database_service
-
-        if database_service.is_available():
-            agent_record = database_service.select_one(
-                "agents", "id", "code = %s AND is_active = 1", (agent_code,)
-            )
-            if agent_record:
-                return agent_record["id"]
-        return 1  # 기본값
-    except Exception as e:
-        logger.error(f"[CHAT_MANAGEMENT] 에이전트 ID 조회 실패: {e}")
-        return 1
@@ -5,9 +5,17 @@ Chat Models for Expert Agent Service
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+# 채팅 요청 OpenAPI 예시 (필드별 example 대신 모델 단위로 한 번만 정의)
+CHAT_REQUEST_EXAMPLE: Dict[str, Any] = {
+    "question": "LG전자의 최신 스마트폰 기술에 대해 알려주세요",
+    "user_id": "hq15",
+    "chat_group_id": "092ff3a4-7a2d-40f3-9518-95d1d352bdb2",
+}
 
 
 class ChatRequest(BaseModel):
@@ -18,38 +26,37 @@ class ChatRequest(BaseModel):
     간소화된 구조로 필수 정보만 포함합니다.
     """
 
-    question: str = Field(
-        ...,
-        description="사용자가 AI 에이전트에게 질문하는 내용",
-        example="LG전자의 최신 스마트폰 기술에 대해 알려주세요",
-        min_length=1,
-        max_length=2000,
-    )
-
-    user_id: str = Field(
-        ...,
-        description="사용자를 식별하는 고유 ID",
-        example="hq15",
-        min_length=1,
-        max_length=100,
+    question: Annotated[
+        str,
+        Field(
+            description="사용자가 AI 에이전트에게 질문하는 내용",
+            min_length=1,
+            max_length=2000,
+        ),
+    ]
+
+    user_id: Annotated[
+        str,
+        Field(
+            description="사용자를 식별하는 고유 ID",
+            min_length=1,
+            max_length=100,
+        ),
+    ]
+
+    chat_group_id: Annotated[
+        str,
+        Field(
+            description="채팅 세션을 식별하는 고유 ID (session_id로 사용됨)",
+            max_length=255,
+        ),
+    ] = ""
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={"example": CHAT_REQUEST_EXAMPLE},
     )
 
-    chat_group_id: str = Field(
-        "",
-        description="채팅 세션을 식별하는 고유 ID (session_id로 사용됨)",
-        example="092ff3a4-7a2d-40f3-9518-95d1d352bdb2",
-        max_length=255,
-    )
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "question": "LG전자의 최신 스마트폰 기술에 대해 알려주세요",
-                "user_id": "hq15",
-                "chat_group_id": "092ff3a4-7a2d-40f3-9518-95d1d352bdb2",
-            }
-        }
-
 
 class ChatMessageResponse(BaseModel):
     """채팅 메시지 응답 모델"""
@@ -71,8 +78,10 @@ class ChatMessageResponse(BaseModel):
     created_at: datetime = Field(..., description="생성 시간")
     updated_at: datetime = Field(..., description="수정 시간")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "id": 123,
                 "channel_id": 45,
@@ -85,7 +94,14 @@ class ChatMessageResponse(BaseModel):
                 "created_at": "2024-01-15T10:30:00Z",
                 "updated_at": "2024-01-15T10:30:00Z",
             }
-        }
+        },
+    )
+
+    @field_validator("message_type", mode="before")
+    @classmethod
+    def _message_type_value(cls, value):
+        """ORM 열거형 값을 문자열로 변환"""
+        return getattr(value, "value", value)
 
 
 class ChatChannelResponse(BaseModel):
@@ -105,8 +121,10 @@ class ChatChannelResponse(BaseModel):
     created_at: datetime = Field(..., description="생성 시간")
     updated_at: datetime = Field(..., description="수정 시간")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "id": 45,
                 "session_id": "092ff3a4-7a2d-40f3-9518-95d1d352bdb2",
@@ -123,7 +141,14 @@ class ChatChannelResponse(BaseModel):
                 "created_at": "2024-01-15T10:30:00Z",
                 "updated_at": "2024-01-15T10:35:00Z",
             }
-        }
+        },
+    )
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def _status_value(cls, value):
+        """ORM 열거형 값을 문자열로 변환"""
+        return getattr(value, "value", value)
 
 
 class ChatChannelWithMessagesResponse(ChatChannelResponse):
@@ -133,8 +158,9 @@ class ChatChannelWithMessagesResponse(ChatChannelResponse):
         default_factory=list, description="채팅 메시지 목록"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "id": 45,
                 "session_id": "092ff3a4-7a2d-40f3-9518-95d1d352bdb2",
@@ -168,7 +194,8 @@ class ChatChannelWithMessagesResponse(ChatChannelResponse):
                     }
                 ],
             }
-        }
+        },
+    )
 
 
 class ChatChannelListResponse(BaseModel):
@@ -179,8 +206,9 @@ class ChatChannelListResponse(BaseModel):
     page: int = Field(..., description="현재 페이지")
     page_size: int = Field(..., description="페이지 크기")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "channels": [
                     {
@@ -201,4 +229,5 @@ class ChatChannelListResponse(BaseModel):
                 "page": 1,
                 "page_size": 20,
             }
-        }
+        },
+    )
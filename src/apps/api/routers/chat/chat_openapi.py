@@ -0,0 +1,163 @@
+"""
+Chat Router OpenAPI 문서 정의
+
+채팅 라우터 데코레이터에서 참조하는 description/responses 상수
+"""
+
+from typing import Any, Dict
+
+# 스트림 상태 스키마 (목록/단건 조회 응답에서 공유)
+_STREAM_STATE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "chat_group_id": {"type": "string"},
+        "agent_code": {"type": "string"},
+        "user_id": {"type": "string"},
+        "connected_clients": {"type": "number"},
+        "is_active": {"type": "boolean"},
+        "created_at": {"type": "string"},
+        "last_activity": {"type": "string"},
+    },
+}
+
+
+def _detail_schema(example: str) -> Dict[str, Any]:
+    """HTTPException detail 형태의 오류 응답 스키마"""
+    return {
+        "type": "object",
+        "properties": {"detail": {"type": "string", "example": example}},
+    }
+
+
+STREAM_DESCRIPTION = """
+    AI 에이전트와 실시간으로 채팅을 진행합니다.
+    
+    **주요 기능:**
+    - SSE(Server-Sent Events)를 통한 실시간 스트리밍 응답
+    - 에이전트별 맞춤형 응답 생성
+    - 채팅 히스토리 자동 저장
+    - 세션 기반 대화 관리
+    
+    **요청 형식:**
+    ```json
+    {
+        "question": "사용자 질문",
+        "user_id": "사용자 ID",
+        "chat_group_id": "세션 ID (채팅방 식별자)"
+    }
+    ```
+    
+    **응답 형식:**
+    - `text/event-stream` 타입의 SSE 스트림
+    - 각 이벤트는 JSON 형태의 데이터 포함
+    - `done: true`로 스트림 종료 표시
+    """
+
+STREAM_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "성공적인 SSE 스트림 응답",
+        "content": {
+            "text/event-stream": {
+                "schema": {
+                    "type": "string",
+                    "example": 'data: {"type": "llm", "token": "안녕하세요", "done": false}\n\n',
+                }
+            }
+        },
+    },
+    400: {
+        "description": "잘못된 요청",
+        "content": {
+            "application/json": {"schema": _detail_schema("필수 필드가 누락되었습니다")}
+        },
+    },
+    500: {
+        "description": "서버 내부 오류",
+        "content": {
+            "application/json": {"schema": _detail_schema("처리 중 오류가 발생했습니다")}
+        },
+    },
+}
+
+
+HEALTH_DESCRIPTION = """
+    특정 에이전트의 채팅 서비스 상태를 확인합니다.
+    
+    **응답 정보:**
+    - 서비스 상태 (healthy/unhealthy)
+    - 에이전트 코드
+    - 서비스 이름
+    - 현재 타임스탬프
+    """
+
+HEALTH_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "서비스 상태 정보",
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "status": {"type": "string", "example": "healthy"},
+                        "service": {
+                            "type": "string",
+                            "example": "CAIA Chat Service",
+                        },
+                        "agent_code": {"type": "string", "example": "caia"},
+                        "timestamp": {"type": "number", "example": 1703123456.789},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+ACTIVE_STREAMS_DESCRIPTION = """
+    현재 활성화된 스트림들의 상태를 조회합니다.
+    
+    **응답 정보:**
+    - 활성 스트림 목록
+    - 각 스트림의 상태 정보
+    - 연결된 클라이언트 수
+    """
+
+ACTIVE_STREAMS_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "활성 스트림 정보",
+        "content": {
+            "application/json": {
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "active_streams": {
+                            "type": "array",
+                            "items": _STREAM_STATE_SCHEMA,
+                        },
+                        "total_count": {"type": "number"},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+STREAM_INFO_DESCRIPTION = """
+    특정 chat_group_id의 스트림 상태를 조회합니다.
+    """
+
+STREAM_INFO_RESPONSES: Dict[int, Dict[str, Any]] = {
+    200: {
+        "description": "스트림 상태 정보",
+        "content": {
+            "application/json": {"schema": _STREAM_STATE_SCHEMA}
+        },
+    },
+    404: {
+        "description": "스트림을 찾을 수 없음",
+        "content": {
+            "application/json": {"schema": _detail_schema("스트림을 찾을 수 없습니다")}
+        },
+    },
+}
@@ -5,28 +5,58 @@ SSE 기반 채팅 인터페이스
 """
 
 import asyncio
-import json
 import os
+import random
+import time
 from logging import getLogger
 from typing import Any, AsyncGenerator, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from src.database.connection import get_database_session
 from src.database.models import ChatChannelStatus, MessageType
 from src.database.services import chat_channel_service, chat_message_service
+from src.apps.api.utils.sse import sse_error
 from src.database.services.lgenie_sync_service import lgenie_sync_service
 from src.utils.log_collector import collector
 
 from .chat_generator import ChatResponseGenerator
 from .chat_models import ChatRequest
+from .chat_openapi import (
+    STREAM_DESCRIPTION,
+    STREAM_RESPONSES,
+    HEALTH_DESCRIPTION,
+    HEALTH_RESPONSES,
+    ACTIVE_STREAMS_DESCRIPTION,
+    ACTIVE_STREAMS_RESPONSES,
+    STREAM_INFO_DESCRIPTION,
+    STREAM_INFO_RESPONSES,
+)
+from .db_executor import run_db
+from .id_resolver import get_agent_id, get_numeric_user_id
+from .lgenie_sync_tasks import schedule_lgenie_message_sync, schedule_lgenie_prereqs
 from .stream_manager import stream_manager
 
 logger = getLogger("chat")
 
+# 세션 쿠키 이름 (프로세스 시작 시 한 번만 환경 변수에서 읽음)
+SESSION_COOKIE_NAME = os.getenv("SESSION_COOKIE_NAME", "sid")
+
+# 클라이언트 ID 생성용 난수 생성기 (요청마다 커널 난수를 읽지 않도록 프로세스 시작 시 한 번만 시드)
+_client_id_rng = random.Random()
+
+
+def _client_id() -> str:
+    """시간순 정렬 가능한 클라이언트 ID 생성 (나노초 타임스탬프 + 48비트 난수)"""
+    return f"{time.time_ns():x}{_client_id_rng.getrandbits(48):012x}"
+
+
+# 스트리밍 중 클라이언트 연결 해제 확인 최소 간격 (토큰마다 확인하지 않도록 제한)
+_DISCONNECT_CHECK_INTERVAL_SECONDS = 0.05
+
 
 # main.py에서 생성된 오케스트레이터 팩토리를 가져오기 위한 의존성
 def get_orchestrator_factory(request: Request):
@@ -36,6 +66,8 @@ def get_orchestrator_factory(request: Request):
 # 동적 에이전트 라우터 (path parameter 사용)
 agent_router = APIRouter(
     prefix="/{agent_code}/api/v1/chat",
+    # JSON 응답은 jsonable_encoder 대신 orjson으로 직렬화 (SSE 스트림은 StreamingResponse 그대로)
+    default_response_class=ORJSONResponse,
     tags=["AI 에이전트 채팅"],
     responses={
         404: {"description": "에이전트를 찾을 수 없습니다"},
@@ -47,32 +79,42 @@ agent_router = APIRouter(
 async def get_or_create_chat_channel(
     db: Session, session_id: str, user_id: str, agent_code: str, question: str
 ):
-    """채팅방을 조회하거나 생성합니다."""
-    try:
-        # LGenie 존재 여부
-        lgenie_exists = lgenie_sync_service.check_chat_group_exists(session_id)
+    """
+    채팅방을 조회하거나 생성합니다.
 
-        # 기존 채널 조회 또는 생성
-        channel = chat_channel_service.get_by_session_id(db, session_id)
+    Returns:
+        (채팅방, 에이전트 ID) 튜플 (실패 시 채팅방은 None)
+    """
+    try:
+        # LGenie 존재 여부와 기존 채널 조회는 서로 독립적이므로 동시에 실행
+        # (LGenie 조회는 별도 DB 연결을 사용하므로 요청 세션과 겹치지 않음)
+        lgenie_exists, channel = await asyncio.gather(
+            run_db(lgenie_sync_service.check_chat_group_exists, session_id),
+            run_db(chat_channel_service.get_by_session_id, db, session_id),
+        )
         if channel:
-            lgenie_sync_service.ensure_lgenie_prereqs(
-                session_id,
-                str(channel.user_id),
-                agent_code,
-                channel.created_at,
-                channel.updated_at,
-                "ensure_group_and_chat",
+            schedule_lgenie_prereqs(session_id, agent_code, channel)
+            # 채널 행에 저장된 agent_id를 그대로 사용 (추가 조회 없음)
+            return channel, channel.agent_id
+
+        # 새 채팅방 생성 (사용자/에이전트 ID 조회는 별도 세션을 사용하므로 동시에 실행)
+        numeric_user_id, agent_id = await asyncio.gather(
+            run_db(get_numeric_user_id, user_id),
+            run_db(get_agent_id, agent_code),
+        )
+        # 알 수 없는 사용자/에이전트로는 채팅방을 만들지 않음 (기본 ID로 대체하지 않음)
+        if numeric_user_id is None or agent_id is None:
+            logger.warning(
+                f"채팅방 생성 불가: user_id={user_id} -> {numeric_user_id}, "
+                f"agent_code={agent_code} -> {agent_id}"
             )
-            return channel
-
-        # 새 채팅방 생성
-        numeric_user_id = await _get_numeric_user_id(db, user_id)
-        agent_id = await _get_agent_id(db, agent_code)
+            return None, None
 
         # 제목 결정
         title = f"채팅 {session_id[:8]}..." if lgenie_exists else f"test_{session_id}"
 
-        channel = chat_channel_service.create_channel(
+        channel = await run_db(
+            chat_channel_service.create_channel,
             db,
             session_id=session_id,
             user_id=numeric_user_id,
@@ -85,56 +127,14 @@ async def get_or_create_chat_channel(
                 "lgenie_exists": lgenie_exists,
             },
         )
-        # 채널 생성 후 LGenie 선행 조건 보장
+        # 채널 생성 후 LGenie 선행 조건 보장 (백그라운드)
         if channel:
-            lgenie_sync_service.ensure_lgenie_prereqs(
-                session_id,
-                str(channel.user_id),
-                agent_code,
-                channel.created_at,
-                channel.updated_at,
-                "ensure_group_and_chat",
-            )
-        return channel
+            schedule_lgenie_prereqs(session_id, agent_code, channel)
+        return channel, agent_id
 
     except Exception as e:
         logger.error(f"채팅방 조회/생성 실패: {e}")
-        return None
-
-
-async def _get_numeric_user_id(db: Session, user_id: str) -> int:
-    """사용자 ID를 숫자 ID로 변환합니다."""
-    try:
-        return int(user_id)
-    except ValueError:
-        try:
-            from src.database.services import database_service
-
-            if database_service.is_available():
-                user_record = database_service.select_one(
-                    "users", "id", "user_id = %s", (user_id,)
-                )
-                return user_record["id"] if user_record else 1
-            return 1
-        except Exception as e:
-            logger.error(f"사용자 ID 조회 실패: {e}")
-            return 1
-
-
-async def _get_agent_id(db: Session, agent_code: str) -> int:
-    """에이전트 코드로 에이전트 ID를 조회합니다."""
-    try:
-        from src.database.services import database_service
-
-        if database_service.is_available():
-            agent_record = database_service.select_one(
-                "agents", "id", "code = %s AND is_active = 1", (agent_code,)
-            )
-            return agent_record["id"] if agent_record else 1
-        return 1
-    except Exception as e:
-        logger.error(f"에이전트 ID 조회 실패: {e}")
-        return 1
+        return None, None
 
 
 async def save_user_message(
@@ -143,23 +143,22 @@ async def save_user_message(
     content: str,
     agent_id: int,
     message_metadata: dict = None,
-):
-    """사용자 메시지를 저장합니다."""
+    session_id: Optional[str] = None,
+) -> Optional[int]:
+    """사용자 메시지를 저장하고 메시지 ID를 반환합니다 (LGenie 동기화는 백그라운드로 실행)."""
     try:
-        msg = chat_message_service.create(
+        message_id = await run_db(
+            chat_message_service.create_and_touch_channel,
             db,
-            channel_id=channel_id,
+            channel_id,
             agent_id=agent_id,
             message_type=MessageType.USER,
             content=content,
             message_metadata=message_metadata or {},
         )
-        try:
-            if msg:
-                lgenie_sync_service.sync_chat_message(msg, db)
-        except Exception as e:
-            logger.warning(f"LGenie 메시지 동기화 실패(무시됨): {e}")
-        return msg
+        if message_id:
+            schedule_lgenie_message_sync(session_id, message_id)
+        return message_id
     except Exception as e:
         logger.error(f"사용자 메시지 저장 실패: {e}")
         return None
@@ -174,7 +173,7 @@ async def generate_chat_response(
     db: Session = None,
     client_id: str | None = None,
     tools: Optional[List[str]] = None,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[str | bytes, None]:
     """오케스트레이터를 사용하여 채팅 응답 생성 (SSE 스트리밍)"""
 
     # 에이전트별 오케스트레이터 가져오기
@@ -182,25 +181,22 @@ async def generate_chat_response(
 
     if orchestrator is None:
         logger.error(f"{agent_code} 에이전트용 오케스트레이터를 찾을 수 없습니다.")
-        yield f"data: {json.dumps({'type': 'error', 'content': f'{agent_code} 에이전트를 찾을 수 없습니다.'})}\n\n"
+        yield sse_error(f"{agent_code} 에이전트를 찾을 수 없습니다.")
         return
 
     # 채팅방 조회 또는 생성
     channel = None
-    user_message = None
+    user_message_id = None
 
     if db and session_id:
         try:
-            channel = await get_or_create_chat_channel(
+            channel, agent_id = await get_or_create_chat_channel(
                 db, session_id, user_id, agent_code, question
             )
 
             if channel:
-                # 에이전트 ID 조회
-                agent_id = await _get_agent_id(db, agent_code)
-
                 # 사용자 메시지 저장
-                user_message = await save_user_message(
+                user_message_id = await save_user_message(
                     db,
                     channel.id,
                     question,
@@ -209,6 +205,7 @@ async def generate_chat_response(
                         "total_token": len(question.split()),  # 간소화된 메타데이터
                         "model": ["user_input"],  # 사용자 입력은 모델이 없음
                     },
+                    session_id=session_id,
                 )
                 # 메시지 동기화는 save_user_message 내부에서 수행됨
             else:
@@ -226,7 +223,7 @@ async def generate_chat_response(
     # 채팅방과 사용자 메시지 정보를 generator에 전달
     if channel:
         generator.channel_id = channel.id
-        generator.user_message_id = user_message.id if user_message else None
+        generator.user_message_id = user_message_id
         collector.log("channel_id", generator.channel_id)
         collector.log("user_message_id", generator.user_message_id)
 
@@ -250,74 +247,8 @@ async def generate_chat_response(
 @agent_router.post(
     "/stream",
     summary="AI 에이전트와 실시간 채팅",
-    description="""
-    AI 에이전트와 실시간으로 채팅을 진행합니다.
-    
-    **주요 기능:**
-    - SSE(Server-Sent Events)를 통한 실시간 스트리밍 응답
-    - 에이전트별 맞춤형 응답 생성
-    - 채팅 히스토리 자동 저장
-    - 세션 기반 대화 관리
-    
-    **요청 형식:**
-    ```json
-    {
-        "question": "사용자 질문",
-        "user_id": "사용자 ID",
-        "chat_group_id": "세션 ID (채팅방 식별자)"
-    }
-    ```
-    
-    **응답 형식:**
-    - `text/event-stream` 타입의 SSE 스트림
-    - 각 이벤트는 JSON 형태의 데이터 포함
-    - `done: true`로 스트림 종료 표시
-    """,
-    responses={
-        200: {
-            "description": "성공적인 SSE 스트림 응답",
-            "content": {
-                "text/event-stream": {
-                    "schema": {
-                        "type": "string",
-                        "example": 'data: {"type": "llm", "token": "안녕하세요", "done": false}\n\n',
-                    }
-                }
-            },
-        },
-        400: {
-            "description": "잘못된 요청",
-            "content": {
-                "application/json": {
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "detail": {
-                                "type": "string",
-                                "example": "필수 필드가 누락되었습니다",
-                            }
-                        },
-                    }
-                }
-            },
-        },
-        500: {
-            "description": "서버 내부 오류",
-            "content": {
-                "application/json": {
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "detail": {
-                                "type": "string",
-                                "example": "처리 중 오류가 발생했습니다",
-                            }
-                        },
-                    }
-                }
-            },
-        },
-    },
+    description=STREAM_DESCRIPTION,
+    responses=STREAM_RESPONSES,
     tags=["채팅"],
 )
 async def dynamic_agent_chat_stream(
@@ -351,7 +282,7 @@ async def dynamic_agent_chat_stream(
     user_query = chat_req.question
     user_id = chat_req.user_id
     session_id = chat_req.chat_group_id
-    cookie_sid = request.cookies.get(os.getenv("SESSION_COOKIE_NAME", "sid"))
+    cookie_sid = request.cookies.get(SESSION_COOKIE_NAME)
     final_session_id = session_id or cookie_sid or None
 
     # Tools 파라미터 파싱
@@ -361,9 +292,7 @@ async def dynamic_agent_chat_stream(
         collector.log("tools", tools_list)
 
     # 클라이언트 ID 생성 (요청별 고유 식별자)
-    import uuid
-
-    client_id = str(uuid.uuid4())
+    client_id = _client_id()
 
     collector.log("user_query", user_query)
     collector.log("user_id", user_id)
@@ -372,15 +301,14 @@ async def dynamic_agent_chat_stream(
     collector.log("final_session_id", final_session_id)
     collector.log("client_id", client_id)
 
-    # db가 제너레이터인 경우 처리
-    db_session = next(db) if hasattr(db, "__next__") else db
-
     async def safe_generate_response():
         """안전한 응답 생성기 - CancelledError 처리"""
+        is_disconnected = request.is_disconnected
         try:
             # 클라이언트 연결 상태 확인
-            if await request.is_disconnected():
+            if await is_disconnected():
                 return
+            last_disconnect_check = time.monotonic()
 
             async for chunk in generate_chat_response(
                 orchestrator_factory,
@@ -388,17 +316,16 @@ async def dynamic_agent_chat_stream(
                 user_id,
                 agent_code=agent_code,
                 session_id=final_session_id,
-                db=db_session,
+                db=db,
                 client_id=client_id,
                 tools=tools_list,
             ):
-                # 클라이언트 연결 상태 주기적 확인
-                if await request.is_disconnected():
-                    break
-
-                # chunk가 코루틴인 경우 await 처리
-                if asyncio.iscoroutine(chunk):
-                    chunk = await chunk
+                # 클라이언트 연결 상태 주기적 확인 (최소 간격마다 한 번)
+                now = time.monotonic()
+                if now - last_disconnect_check > _DISCONNECT_CHECK_INTERVAL_SECONDS:
+                    if await is_disconnected():
+                        break
+                    last_disconnect_check = now
 
                 yield chunk
         except asyncio.CancelledError:
@@ -406,20 +333,24 @@ async def dynamic_agent_chat_stream(
             # 클라이언트 연결 해제 시 스트림에서 제거
             if final_session_id and client_id:
                 stream_manager.remove_client_from_stream(final_session_id, client_id)
-            yield f"data: {json.dumps({'type': 'error', 'content': '요청이 취소되었습니다.'})}\n\n"
+            # 끊긴 연결에 오류 프레임을 쓰지 않고 취소를 그대로 전파
+            raise
         except Exception as e:
             logger.error(f"{agent_code} 채팅 응답 생성 중 오류: {e}")
             # 오류 발생 시에도 클라이언트 제거
             if final_session_id and client_id:
                 stream_manager.remove_client_from_stream(final_session_id, client_id)
-            yield f"data: {json.dumps({'type': 'error', 'content': f'처리 중 오류가 발생했습니다: {str(e)}'})}\n\n"
+            yield sse_error(f"처리 중 오류가 발생했습니다: {str(e)}")
 
     return StreamingResponse(
         safe_generate_response(),
         media_type="text/event-stream",
+        # X-Accel-Buffering: nginx가 토큰을 모아서 보내지 않도록 프록시 버퍼링 해제
+        # (nginx location 설정에도 `proxy_buffering off; chunked_transfer_encoding off;` 필요)
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
             "Access-Control-Allow-Origin": "*",
         },
     )
@@ -428,36 +359,8 @@ async def dynamic_agent_chat_stream(
 @agent_router.get(
     "/health",
     summary="에이전트 채팅 서비스 상태 확인",
-    description="""
-    특정 에이전트의 채팅 서비스 상태를 확인합니다.
-    
-    **응답 정보:**
-    - 서비스 상태 (healthy/unhealthy)
-    - 에이전트 코드
-    - 서비스 이름
-    - 현재 타임스탬프
-    """,
-    responses={
-        200: {
-            "description": "서비스 상태 정보",
-            "content": {
-                "application/json": {
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "status": {"type": "string", "example": "healthy"},
-                            "service": {
-                                "type": "string",
-                                "example": "CAIA Chat Service",
-                            },
-                            "agent_code": {"type": "string", "example": "caia"},
-                            "timestamp": {"type": "number", "example": 1703123456.789},
-                        },
-                    }
-                }
-            },
-        }
-    },
+    description=HEALTH_DESCRIPTION,
+    responses=HEALTH_RESPONSES,
     tags=["상태 확인"],
 )
 async def dynamic_agent_chat_health(agent_code: str) -> Dict[str, Any]:
@@ -481,108 +384,36 @@ async def dynamic_agent_chat_health(agent_code: str) -> Dict[str, Any]:
 @agent_router.get(
     "/streams",
     summary="활성 스트림 상태 조회",
-    description="""
-    현재 활성화된 스트림들의 상태를 조회합니다.
-    
-    **응답 정보:**
-    - 활성 스트림 목록
-    - 각 스트림의 상태 정보
-    - 연결된 클라이언트 수
-    """,
-    responses={
-        200: {
-            "description": "활성 스트림 정보",
-            "content": {
-                "application/json": {
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "active_streams": {
-                                "type": "array",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "chat_group_id": {"type": "string"},
-                                        "agent_code": {"type": "string"},
-                                        "user_id": {"type": "string"},
-                                        "connected_clients": {"type": "number"},
-                                        "is_active": {"type": "boolean"},
-                                        "created_at": {"type": "string"},
-                                        "last_activity": {"type": "string"},
-                                    },
-                                },
-                            },
-                            "total_count": {"type": "number"},
-                        },
-                    }
-                }
-            },
-        }
-    },
+    description=ACTIVE_STREAMS_DESCRIPTION,
+    responses=ACTIVE_STREAMS_RESPONSES,
     tags=["스트림 관리"],
 )
-async def get_active_streams() -> Dict[str, Any]:
+async def get_active_streams() -> ORJSONResponse:
     """
     활성 스트림 상태를 조회합니다.
 
     Returns:
-        Dict[str, Any]: 활성 스트림 정보
+        ORJSONResponse: 활성 스트림 정보
     """
-    active_streams = stream_manager.get_active_streams()
-    stream_info = []
-
-    for chat_group_id, stream_state in active_streams.items():
-        stream_info.append(stream_state.to_dict())
-
-    return {
-        "active_streams": stream_info,
-        "total_count": len(stream_info),
-    }
+    # to_dict 결과는 JSON 기본 타입만 포함하므로 jsonable_encoder 없이 바로 직렬화
+    stream_info = [
+        stream_state.to_dict()
+        for stream_state in stream_manager.get_active_streams().values()
+    ]
+
+    return ORJSONResponse(
+        content={
+            "active_streams": stream_info,
+            "total_count": len(stream_info),
+        }
+    )
 
 
 @agent_router.get(
     "/streams/{chat_group_id}",
     summary="특정 스트림 상태 조회",
-    description="""
-    특정 chat_group_id의 스트림 상태를 조회합니다.
-    """,
-    responses={
-        200: {
-            "description": "스트림 상태 정보",
-            "content": {
-                "application/json": {
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "chat_group_id": {"type": "string"},
-                            "agent_code": {"type": "string"},
-                            "user_id": {"type": "string"},
-                            "connected_clients": {"type": "number"},
-                            "is_active": {"type": "boolean"},
-                            "created_at": {"type": "string"},
-                            "last_activity": {"type": "string"},
-                        },
-                    }
-                }
-            },
-        },
-        404: {
-            "description": "스트림을 찾을 수 없음",
-            "content": {
-                "application/json": {
-                    "schema": {
-                        "type": "object",
-                        "properties": {
-                            "detail": {
-                                "type": "string",
-                                "example": "스트림을 찾을 수 없습니다",
-                            }
-                        },
-                    }
-                }
-            },
-        },
-    },
+    description=STREAM_INFO_DESCRIPTION,
+    responses=STREAM_INFO_RESPONSES,
     tags=["스트림 관리"],
 )
 async def get_stream_info(chat_group_id: str) -> Dict[str, Any]:
@@ -0,0 +1,40 @@
+"""
+Chat DB Executor
+채팅 경로의 동기 DB/외부 호출을 이벤트 루프 밖에서 실행하는 전용 스레드 풀
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from typing import Any, Callable, TypeVar
+
+logger = getLogger("chat_db_executor")
+
+T = TypeVar("T")
+
+# 기본 스레드 풀(asyncio.to_thread)과 분리하여 DB 작업이 다른 작업과 경쟁하지 않도록 함
+_DB_EXECUTOR_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+db_executor = ThreadPoolExecutor(
+    max_workers=_DB_EXECUTOR_MAX_WORKERS, thread_name_prefix="chat_db"
+)
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """동기 함수를 DB 전용 스레드 풀에서 실행합니다 (contextvars 유지)."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(
+        db_executor, functools.partial(ctx.run, func, *args, **kwargs)
+    )
+
+
+def shutdown_db_executor() -> None:
+    """DB 전용 스레드 풀 종료 (진행 중인 작업은 완료까지 대기)"""
+    try:
+        db_executor.shutdown(wait=True, cancel_futures=True)
+    except Exception as e:
+        logger.error(f"[DB_EXECUTOR] 스레드 풀 종료 실패: {e}")
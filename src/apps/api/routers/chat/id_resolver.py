@@ -0,0 +1,95 @@
+"""
+Chat ID Resolver
+채팅 라우터/응답 생성기에서 공통으로 사용하는 사용자/에이전트 ID 조회 (조회에 성공한 값만 TTL 캐시)
+"""
+
+from typing import Optional
+
+from sqlalchemy import bindparam, select
+
+from src.apps.api.utils.ttl_cache import TTLCache
+from src.database.connection.connection import get_session_local
+from src.database.models import Agent, User
+
+# ID 조회 구문 (모듈 로드 시 1회 구성하여 SQLAlchemy 컴파일 캐시 재사용, 요청별 값은 bindparam으로 전달)
+# 모두 PK 또는 유니크 인덱스(users.user_id, agents.code)를 사용
+_USER_BY_PK_STMT = select(User.id, User.user_id).where(User.id == bindparam("pk"))
+_USER_BY_LOGIN_ID_STMT = select(User.id, User.user_id).where(
+    User.user_id == bindparam("user_id")
+)
+_ACTIVE_AGENT_ID_BY_CODE_STMT = select(Agent.id).where(
+    Agent.code == bindparam("code"), Agent.is_active.is_(True)
+)
+
+# 요청 user_id -> (숫자 ID, 로그인 ID), agent_code -> 에이전트 ID 캐시
+_ID_CACHE_TTL_SECONDS = 300.0
+_USER_CACHE_MAXSIZE = 10_000
+_AGENT_CACHE_MAXSIZE = 1024
+_user_cache: TTLCache[str, tuple[int, str]] = TTLCache(
+    _ID_CACHE_TTL_SECONDS, _USER_CACHE_MAXSIZE
+)
+_agent_id_cache: TTLCache[str, int] = TTLCache(
+    _ID_CACHE_TTL_SECONDS, _AGENT_CACHE_MAXSIZE
+)
+
+
+def get_cached_user_identity(user_id: str) -> Optional[tuple[int, str]]:
+    """캐시된 사용자 ID 매핑 조회 (없거나 만료 시 None, DB 조회 없음)"""
+    return _user_cache.get(user_id)
+
+
+def get_user_identity(user_id: str) -> Optional[tuple[int, str]]:
+    """
+    요청 user_id(숫자 ID 또는 로그인 ID)를 (숫자 ID, 로그인 ID)로 변환합니다.
+
+    존재하지 않는 사용자면 None을 반환하며, 조회 오류는 호출부로 전파됩니다.
+    """
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    try:
+        stmt, params = _USER_BY_PK_STMT, {"pk": int(user_id)}
+    except ValueError:
+        stmt, params = _USER_BY_LOGIN_ID_STMT, {"user_id": user_id}
+
+    with get_session_local()() as session:
+        row = session.execute(stmt, params).first()
+    if row is None:
+        return None
+
+    identity = (row.id, row.user_id)
+    _user_cache.set(user_id, identity)
+    return identity
+
+
+def get_numeric_user_id(user_id: str) -> Optional[int]:
+    """
+    사용자 ID를 숫자 ID로 변환합니다. (숫자 문자열은 DB 조회 없이 변환)
+
+    존재하지 않는 사용자면 None을 반환하며, 조회 오류는 호출부로 전파됩니다.
+    """
+    try:
+        return int(user_id)
+    except ValueError:
+        identity = get_user_identity(user_id)
+        return identity[0] if identity else None
+
+
+def get_agent_id(agent_code: str) -> Optional[int]:
+    """
+    에이전트 코드로 활성 에이전트 ID를 조회합니다.
+
+    존재하지 않거나 비활성이면 None을 반환하며, 조회 오류는 호출부로 전파됩니다.
+    """
+    cached_id = _agent_id_cache.get(agent_code)
+    if cached_id is not None:
+        return cached_id
+
+    with get_session_local()() as session:
+        agent_id = session.execute(
+            _ACTIVE_AGENT_ID_BY_CODE_STMT, {"code": agent_code}
+        ).scalar_one_or_none()
+    if agent_id is not None:
+        _agent_id_cache.set(agent_code, agent_id)
+    return agent_id
@@ -0,0 +1,58 @@
+"""
+LGenie Sync Tasks
+채팅 경로의 LGenie 동기화(선행 조건 보장, 메시지 동기화)를 백그라운드로 실행
+"""
+
+import asyncio
+from logging import getLogger
+from typing import Dict, Optional
+
+from src.database.services.lgenie_sync_service import lgenie_sync_service
+
+from .chat_generator import _spawn_background_task
+from .db_executor import run_db
+
+logger = getLogger("lgenie_sync_tasks")
+
+
+# 세션별 진행 중인 LGenie 선행 조건 보장 태스크 (메시지 동기화가 그룹 생성 이후에 실행되도록 대기용)
+_lgenie_prereq_tasks: Dict[str, asyncio.Task] = {}
+
+
+def schedule_lgenie_prereqs(session_id: str, agent_code: str, channel) -> None:
+    """LGenie 선행 조건 보장을 백그라운드로 실행 (응답 스트림 시작을 지연시키지 않음)"""
+    task = _spawn_background_task(
+        run_db(
+            lgenie_sync_service.ensure_lgenie_prereqs,
+            session_id,
+            str(channel.user_id),
+            agent_code,
+            channel.created_at,
+            channel.updated_at,
+            "ensure_group_and_chat",
+        )
+    )
+    if task is None:
+        return
+    _lgenie_prereq_tasks[session_id] = task
+    task.add_done_callback(
+        lambda t: _lgenie_prereq_tasks.pop(session_id, None)
+        if _lgenie_prereq_tasks.get(session_id) is t
+        else None
+    )
+
+
+async def _sync_message_to_lgenie(message_id: int) -> None:
+    """메시지를 LGenie DB에 동기화 (실패는 무시)"""
+    try:
+        # 요청 세션은 다른 스레드와 공유할 수 없으므로 ID만 넘겨 별도 세션에서 재조회
+        await run_db(lgenie_sync_service.sync_chat_message, message_id, None)
+    except Exception as e:
+        logger.warning(f"LGenie 메시지 동기화 실패(무시됨): {e}")
+
+
+def schedule_lgenie_message_sync(session_id: Optional[str], message_id: int) -> None:
+    """메시지 동기화를 백그라운드로 실행 (같은 세션의 선행 조건 보장이 진행 중이면 완료 후 시작)"""
+    prereq_task = _lgenie_prereq_tasks.get(session_id) if session_id else None
+    # 태스크는 바로 등록하여 앱 종료 시 대기 대상에 포함 (선행 조건 대기 중에는 동시 실행 슬롯을 점유하지 않음)
+    _spawn_background_task(_sync_message_to_lgenie(message_id), after=prereq_task)
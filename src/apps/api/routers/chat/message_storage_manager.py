@@ -8,7 +8,10 @@ from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from src.database.services import chat_channel_service, chat_message_service
+from src.database.services import chat_message_service
+
+from .db_executor import run_db
+from .lgenie_sync_tasks import schedule_lgenie_message_sync
 
 logger = getLogger("message_storage_manager")
 
@@ -27,15 +30,22 @@ class MessageStorageManager:
         agent_name: str,
         user_message_id: int,
         content: str,
+        session_id: Optional[str] = None,
     ) -> Optional[int]:
-        """일반 응답을 데이터베이스에 저장합니다."""
+        """
+        일반 응답을 데이터베이스에 저장합니다.
+
+        session_id를 주면 LGenie 동기화가 같은 세션의 선행 조건 보장 이후에 실행됩니다.
+        """
         if not (db and channel_id and content.strip()):
             return None
 
         try:
-            assistant_message = chat_message_service.create_message(
+            # 메시지 INSERT와 채팅방 마지막 메시지 시간 갱신을 한 번에 커밋
+            assistant_message_id = await run_db(
+                chat_message_service.create_and_touch_channel,
                 db,
-                channel_id=channel_id,
+                channel_id,
                 agent_id=agent_id,
                 message_type=agent_name,
                 content=content.strip(),
@@ -46,12 +56,13 @@ class MessageStorageManager:
                 },
             )
 
-            if assistant_message:
-                chat_channel_service.update_last_message(db, channel_id)
+            if assistant_message_id:
+                # LGenie DB 동기화는 백그라운드로 실행 (실패해도 Main DB 작업은 성공으로 처리)
+                schedule_lgenie_message_sync(session_id, assistant_message_id)
                 self.logger.debug(
-                    f"[MESSAGE_STORAGE] 일반 응답 저장 완료: {assistant_message.id}"
+                    f"[MESSAGE_STORAGE] 일반 응답 저장 완료: {assistant_message_id}"
                 )
-                return assistant_message.id
+                return assistant_message_id
 
         except Exception as e:
             self.logger.error(f"[MESSAGE_STORAGE] 일반 응답 저장 실패: {e}")
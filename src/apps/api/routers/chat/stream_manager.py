@@ -5,14 +5,44 @@ Stream Manager for Expert Agent Service
 """
 
 import asyncio
+import heapq
+import itertools
 import json
-from datetime import datetime, timedelta
+import os
+import time
+from datetime import datetime
 from logging import getLogger
 from typing import Any, Dict, Optional, Set
-from uuid import uuid4
 
 logger = getLogger("stream_manager")
 
+# 스트림 ID 생성용 카운터 (프로세스 내 식별용이므로 PID + 일련번호로 충분)
+_stream_id_counter = itertools.count(1)
+
+# 제거된 스트림에 남겨 두는 빈 클라이언트 집합 (풀에 반환한 set을 더 이상 참조하지 않도록)
+_RELEASED_CLIENTS: frozenset = frozenset()
+
+
+class _SetPool:
+    """연결 클라이언트용 set 재사용 풀 (스트림 생성/제거가 잦을 때 할당 감소)"""
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._free: list[Set[str]] = []
+
+    def acquire(self) -> Set[str]:
+        """비어 있는 set 반환 (풀이 비었으면 새로 생성)"""
+        return self._free.pop() if self._free else set()
+
+    def release(self, item: Set[str]) -> None:
+        """set을 비운 뒤 풀에 반환 (최대 크기 초과분은 버림)"""
+        if len(self._free) < self._maxsize:
+            item.clear()
+            self._free.append(item)
+
+
+_client_set_pool = _SetPool()
+
 
 class StreamState:
     """스트림 상태 정보"""
@@ -21,24 +51,35 @@ class StreamState:
         self.chat_group_id = chat_group_id
         self.agent_code = agent_code
         self.user_id = user_id
-        self.created_at = datetime.now()
-        self.last_activity = datetime.now()
+        # 경과 시간 비교는 monotonic 시계로 하고, 벽시계 시각은 생성 시 한 번만 기록
+        self.created_at = time.monotonic()
+        self.last_activity = self.created_at
+        self._created_wall = time.time()
+        self._created_at_iso = datetime.fromtimestamp(self._created_wall).isoformat()
         self.is_active = True
         self.current_node = None
         self.current_state = None
         self.stream_generator = None
-        self.connected_clients: Set[str] = set()
-        self.stream_id = str(uuid4())
+        self.connected_clients: Set[str] = _client_set_pool.acquire()
+        self.stream_id = f"{os.getpid()}-{next(_stream_id_counter)}"
+        # 생성 후 바뀌지 않는 필드는 to_dict에서 복사만 하도록 미리 구성
+        self._static_snapshot: Dict[str, Any] = {
+            "chat_group_id": chat_group_id,
+            "agent_code": agent_code,
+            "user_id": user_id,
+            "created_at": self._created_at_iso,
+            "stream_id": self.stream_id,
+        }
         
     def add_client(self, client_id: str):
         """클라이언트 연결 추가"""
         self.connected_clients.add(client_id)
-        self.last_activity = datetime.now()
+        self.last_activity = time.monotonic()
         
     def remove_client(self, client_id: str):
         """클라이언트 연결 제거"""
         self.connected_clients.discard(client_id)
-        self.last_activity = datetime.now()
+        self.last_activity = time.monotonic()
         
     def has_clients(self) -> bool:
         """연결된 클라이언트가 있는지 확인"""
@@ -46,21 +87,20 @@ class StreamState:
         
     def is_expired(self, timeout_minutes: int = 30) -> bool:
         """스트림이 만료되었는지 확인"""
-        return datetime.now() - self.last_activity > timedelta(minutes=timeout_minutes)
+        return time.monotonic() - self.last_activity > timeout_minutes * 60
         
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        return {
-            "chat_group_id": self.chat_group_id,
-            "agent_code": self.agent_code,
-            "user_id": self.user_id,
-            "created_at": self.created_at.isoformat(),
-            "last_activity": self.last_activity.isoformat(),
-            "is_active": self.is_active,
-            "current_node": self.current_node,
-            "connected_clients": list(self.connected_clients),
-            "stream_id": self.stream_id
-        }
+        snapshot = self._static_snapshot.copy()
+        snapshot.update(
+            last_activity=datetime.fromtimestamp(
+                self._created_wall + (self.last_activity - self.created_at)
+            ).isoformat(),
+            is_active=self.is_active,
+            current_node=self.current_node,
+            connected_clients=list(self.connected_clients),
+        )
+        return snapshot
 
 
 class StreamManager:
@@ -70,6 +110,9 @@ class StreamManager:
         self._streams: Dict[str, StreamState] = {}
         self._cleanup_task = None
         self._cleanup_interval = 300  # 5분마다 정리
+        self._stream_timeout_seconds = 30 * 60  # StreamState.is_expired 기본값과 동일
+        # (만료 예정 시각, chat_group_id) 힙 - 스트림당 항목 하나를 유지하고 꺼낼 때 실제 만료 여부 재확인
+        self._expiry_heap: list[tuple[float, str]] = []
         
     async def start_cleanup_task(self):
         """정리 작업 시작"""
@@ -81,13 +124,29 @@ class StreamManager:
         while True:
             try:
                 await asyncio.sleep(self._cleanup_interval)
-                current_time = datetime.now()
+                now = time.monotonic()
                 expired_streams = []
-                
-                for chat_group_id, stream_state in self._streams.items():
-                    if stream_state.is_expired() and not stream_state.has_clients():
+                rescheduled = []
+
+                # 만료 예정 시각이 지난 항목만 확인 (전체 스트림 순회 없음)
+                while self._expiry_heap and self._expiry_heap[0][0] <= now:
+                    _, chat_group_id = heapq.heappop(self._expiry_heap)
+                    stream_state = self._streams.get(chat_group_id)
+                    if stream_state is None:
+                        continue
+                    if stream_state.has_clients():
+                        rescheduled.append((now + self._cleanup_interval, chat_group_id))
+                    elif stream_state.is_expired():
                         expired_streams.append(chat_group_id)
-                        
+                    else:
+                        # 그 사이 활동이 있었으면 마지막 활동 기준으로 다시 예약
+                        rescheduled.append(
+                            (stream_state.last_activity + self._stream_timeout_seconds, chat_group_id)
+                        )
+
+                for entry in rescheduled:
+                    heapq.heappush(self._expiry_heap, entry)
+
                 for chat_group_id in expired_streams:
                     await self.remove_stream(chat_group_id)
                     logger.info(f"만료된 스트림 정리: {chat_group_id}")
@@ -104,13 +163,17 @@ class StreamManager:
         if chat_group_id in self._streams:
             # 기존 스트림이 있으면 업데이트
             stream_state = self._streams[chat_group_id]
-            stream_state.last_activity = datetime.now()
+            stream_state.last_activity = time.monotonic()
             stream_state.is_active = True
             logger.info(f"기존 스트림 재활성화: {chat_group_id}")
         else:
             # 새 스트림 생성
             stream_state = StreamState(chat_group_id, agent_code, user_id)
             self._streams[chat_group_id] = stream_state
+            heapq.heappush(
+                self._expiry_heap,
+                (stream_state.last_activity + self._stream_timeout_seconds, chat_group_id),
+            )
             logger.info(f"새 스트림 생성: {chat_group_id}")
             
         return stream_state
@@ -128,6 +191,10 @@ class StreamManager:
                     logger.warning(f"스트림 제너레이터 정리 중 오류: {e}")
                     
             del self._streams[chat_group_id]
+            # 제거된 스트림은 조회되지 않으므로 클라이언트 set을 풀에 반환
+            if isinstance(stream_state.connected_clients, set):
+                _client_set_pool.release(stream_state.connected_clients)
+                stream_state.connected_clients = _RELEASED_CLIENTS
             logger.info(f"스트림 상태 제거: {chat_group_id}")
             
     def add_client_to_stream(self, chat_group_id: str, client_id: str) -> bool:
@@ -152,7 +219,7 @@ class StreamManager:
                 stream_state.current_node = current_node
             if current_state:
                 stream_state.current_state = current_state
-            stream_state.last_activity = datetime.now()
+            stream_state.last_activity = time.monotonic()
             
     def set_stream_generator(self, chat_group_id: str, generator):
         """스트림 제너레이터 설정"""
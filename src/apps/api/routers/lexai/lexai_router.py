@@ -6,6 +6,7 @@ LexAI Router
 
 import json
 import time
+from functools import lru_cache
 from logging import getLogger
 from typing import Any, Dict
 
@@ -53,8 +54,10 @@ lexai_router = APIRouter(
 )
 
 
-def get_orchestrator(agent_code: str = "lexai"):
-    """오케스트레이터를 가져옵니다."""
+# 워크플로우 레지스트리 등록은 앱 시작 시 끝나므로 조회 결과를 에이전트 코드별로 캐시
+# (조회 실패 시 예외가 발생하므로 캐시되지 않고 다음 요청에서 다시 조회)
+@lru_cache(maxsize=8)
+def _resolve_orchestrator(agent_code: str):
     orchestrator = workflow_registry.get_orchestrator(agent_code)
     if not orchestrator:
         raise HTTPException(
@@ -64,8 +67,8 @@ def get_orchestrator(agent_code: str = "lexai"):
     return orchestrator
 
 
-def get_state_builder(agent_code: str = "lexai"):
-    """상태 빌더를 가져옵니다."""
+@lru_cache(maxsize=8)
+def _resolve_state_builder(agent_code: str):
     state_builder = workflow_registry.get_state_builder(agent_code)
     if not state_builder:
         raise HTTPException(
@@ -75,6 +78,17 @@ def get_state_builder(agent_code: str = "lexai"):
     return state_builder
 
 
+# async 의존성은 스레드풀을 거치지 않고 이벤트 루프에서 바로 실행됨
+async def get_orchestrator(agent_code: str = "lexai"):
+    """오케스트레이터를 가져옵니다."""
+    return _resolve_orchestrator(agent_code)
+
+
+async def get_state_builder(agent_code: str = "lexai"):
+    """상태 빌더를 가져옵니다."""
+    return _resolve_state_builder(agent_code)
+
+
 @lexai_router.post(
     "/analyze",
     response_model=RegulationChangeResponse,
@@ -0,0 +1,31 @@
+"""
+Agents List Cache
+
+에이전트 목록 응답 캐시 (UI 폴링 대응, (db_user_id, lang) 키, 짧은 TTL)
+로그인 처리(user_service)와 에이전트 목록 API(auth_router)가 함께 사용하므로 별도 모듈로 분리
+"""
+
+from typing import Any, Dict, Optional
+
+from src.apps.api.utils.ttl_cache import TTLCache
+
+_AGENTS_CACHE_TTL_SECONDS = 10.0
+_AGENTS_CACHE_MAXSIZE = 10_000
+_agents_cache: TTLCache[tuple, Dict[str, Any]] = TTLCache(
+    _AGENTS_CACHE_TTL_SECONDS, _AGENTS_CACHE_MAXSIZE
+)
+
+
+def get_cached_agents(cache_key: tuple) -> Optional[Dict[str, Any]]:
+    """캐시된 에이전트 목록 응답 조회 (만료 시 None)"""
+    return _agents_cache.get(cache_key)
+
+
+def set_cached_agents(cache_key: tuple, content: Dict[str, Any]) -> None:
+    """에이전트 목록 응답 캐시 저장"""
+    _agents_cache.set(cache_key, content)
+
+
+def invalidate_agents_cache(user_id: int) -> None:
+    """사용자의 멤버십이 변경되었을 때 에이전트 목록 캐시 무효화"""
+    _agents_cache.pop_where(lambda key, _: key[0] == user_id)
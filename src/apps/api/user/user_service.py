@@ -5,6 +5,7 @@ User Authentication Service
 """
 
 # CAIA User Authorizer 임포트
+import hashlib
 import sys
 import urllib.parse
 from logging import getLogger
@@ -16,11 +17,18 @@ from src.agents.components.common.user_authorizer import get_authorizer
 from src.apps.api.security.authorization_service import authorization_service
 from src.apps.api.security.crypto import SSOAuthenticationException, decrypt_aes256
 from src.apps.api.security.sso_parser import sso_parser
+from src.apps.api.user.agents_cache import invalidate_agents_cache
 from src.apps.api.user.user_manager import user_manager
+from src.apps.api.utils.ttl_cache import TTLCache
 from src.schemas.user_schemas import user_info_to_dict
 
 logger = getLogger("user_service")
 
+# 쿠키 → 사용자 정보 캐시 설정 (복호화/권한 조회/DB 저장을 짧은 TTL 동안 생략)
+# 다른 워커/SSO 측에서 폐기된 세션이 유효하게 남는 시간을 줄이기 위해 TTL을 짧게 유지
+_COOKIE_CACHE_TTL_SECONDS = 15.0
+_COOKIE_CACHE_MAXSIZE = 10_000
+
 
 class UserAuthService:
     """사용자 인증 서비스 - 리팩토링된 버전"""
@@ -28,6 +36,37 @@ class UserAuthService:
     def __init__(self):
         self.logger = logger
         self.test_mode = False  # 실제 데이터베이스 사용
+        # 검증된 쿠키의 사용자 정보 캐시: (쿠키 해시, agent_filter, agent_code) -> 사용자 정보
+        self._cookie_cache: TTLCache[tuple, Dict[str, Any]] = TTLCache(
+            _COOKIE_CACHE_TTL_SECONDS, _COOKIE_CACHE_MAXSIZE
+        )
+
+    @staticmethod
+    def _cookie_digest(cookie_value: str) -> str:
+        """캐시 키용 쿠키 해시"""
+        return hashlib.blake2b(cookie_value.encode(), digest_size=16).hexdigest()
+
+    def _get_cached_user(self, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """캐시된 사용자 정보 조회 (만료 시 None, 호출자 수정에 대비해 복사본 반환)"""
+        user_dict = self._cookie_cache.get(cache_key)
+        return dict(user_dict) if user_dict is not None else None
+
+    def _set_cached_user(self, cache_key: tuple, user_dict: Dict[str, Any]) -> None:
+        """사용자 정보 캐시 저장 (최대 크기 초과 시 만료/오래된 항목부터 제거)"""
+        self._cookie_cache.set(cache_key, dict(user_dict))
+
+    def invalidate_cookie_cache(self, cookie_value: Optional[str]) -> None:
+        """로그아웃 등으로 쿠키가 무효화될 때 해당 쿠키의 캐시 제거"""
+        if not cookie_value:
+            return
+        digest = self._cookie_digest(cookie_value)
+        self._cookie_cache.pop_where(lambda key, _: key[0] == digest)
+
+    def invalidate_user_cache(self, db_user_id: int) -> None:
+        """멤버십 변경 시 해당 사용자의 모든 쿠키 캐시 제거 (권한 정보 재조회)"""
+        self._cookie_cache.pop_where(
+            lambda _, user_dict: user_dict.get("db_user_id") == db_user_id
+        )
 
     def get_user_from_cookie(
         self,
@@ -52,6 +91,12 @@ class UserAuthService:
                 self.logger.warning("[USER_SERVICE] ssolgenet_exa 쿠키가 없습니다.")
                 return None
 
+            # 검증된 쿠키면 캐시된 사용자 정보 반환 (복호화/권한 조회/DB 저장 생략)
+            cache_key = (self._cookie_digest(cookie_value), agent_filter, agent_code)
+            cached_user = self._get_cached_user(cache_key)
+            if cached_user is not None:
+                return cached_user
+
             # 2. 사용자 ID 추출
             user_id = self._extract_user_id_from_cookie(cookie_value)
             if not user_id:
@@ -86,6 +131,7 @@ class UserAuthService:
             # 6. 데이터베이스 저장 및 메모리 업데이트
             self._save_user_data_and_memory(user_dict)
 
+            self._set_cached_user(cache_key, user_dict)
             return user_dict
 
         except Exception as e:
@@ -170,6 +216,9 @@ class UserAuthService:
                 self._ensure_all_agents_membership(db_user_id)
             except Exception as e:
                 self.logger.error(f"모든 agent에 대한 membership 추가 중 오류: {e}")
+
+            # 로그인 처리 중 멤버십이 생성/갱신될 수 있으므로 에이전트 목록 캐시 무효화
+            invalidate_agents_cache(db_user_id)
             
             # 인사정보를 semantic 메모리에 비동기로 저장 (DB 저장 성공한 경우에만)
             try:
@@ -207,15 +256,10 @@ class UserAuthService:
 
             # context manager를 사용하여 세션 자동 정리
             with get_db_session() as db:
-                # 사용자의 기존 멤버십 확인
-                existing_memberships = membership_service.get_user_agents(
-                    db, db_user_id
-                )
-
                 # 이미 멤버십이 있으면 스킵 (처음 로그인한 사용자가 아님)
-                if existing_memberships:
+                if membership_service.has_enabled_memberships(db, db_user_id):
                     self.logger.debug(
-                        f"사용자 {db_user_id}는 이미 {len(existing_memberships)}개의 멤버십이 있습니다. 스킵합니다."
+                        f"사용자 {db_user_id}는 이미 멤버십이 있습니다. 스킵합니다."
                     )
                     return
 
@@ -238,8 +282,11 @@ class UserAuthService:
                     )
                     if membership:
                         created_count += 1
-                        self.logger.info(
-                            f"사용자 {db_user_id}에게 agent {agent.code} (ID: {agent.id}) 멤버십 추가 완료"
+                        self.logger.debug(
+                            "사용자 %s에게 agent %s (ID: %s) 멤버십 추가 완료",
+                            db_user_id,
+                            agent.code,
+                            agent.id,
                         )
 
                 self.logger.info(
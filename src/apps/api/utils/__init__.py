@@ -0,0 +1,14 @@
+"""
+API Utils Module
+
+API 라우터에서 공통으로 사용하는 유틸리티 모듈
+"""
+
+from .sse import sse, sse_error
+from .ttl_cache import TTLCache
+
+__all__ = [
+    "TTLCache",
+    "sse",
+    "sse_error",
+]
@@ -0,0 +1,26 @@
+"""
+SSE 프레임 유틸리티
+
+라우터에서 직접 구성하는 SSE 프레임을 orjson으로 직렬화합니다.
+"""
+
+from typing import Any, Dict
+
+import orjson
+
+_DATA_PREFIX = b"data: "
+_FRAME_SUFFIX = b"\n\n"
+
+# 오류 프레임 템플릿 (content 문자열만 직렬화해서 끼워 넣음)
+_ERROR_FRAME_PREFIX = _DATA_PREFIX + b'{"type":"error","content":'
+_ERROR_FRAME_SUFFIX = b"}" + _FRAME_SUFFIX
+
+
+def sse(event: Dict[str, Any]) -> bytes:
+    """이벤트 딕셔너리를 `data: {...}\\n\\n` 형식의 SSE 프레임(bytes)으로 변환합니다."""
+    return _DATA_PREFIX + orjson.dumps(event) + _FRAME_SUFFIX
+
+
+def sse_error(content: str) -> bytes:
+    """`{"type": "error", "content": ...}` SSE 프레임 생성 (content만 직렬화)"""
+    return _ERROR_FRAME_PREFIX + orjson.dumps(content) + _ERROR_FRAME_SUFFIX
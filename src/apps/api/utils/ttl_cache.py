@@ -0,0 +1,66 @@
+"""
+TTL 캐시
+
+라우터/서비스에서 공통으로 사용하는 만료 시간 및 최대 크기 제한이 있는 메모리 캐시
+(이벤트 루프와 스레드 풀 양쪽에서 접근하므로 내부 잠금으로 보호)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """항목별 만료 시각을 가진 크기 제한 캐시 (최대 크기 초과 시 만료/오래된 항목부터 제거)"""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[K, Tuple[float, V]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """캐시된 값 조회 (없거나 만료 시 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """값 저장 (기존 항목은 만료 시각 갱신)"""
+        with self._lock:
+            now = time.monotonic()
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                for k in [k for k, (exp, _) in self._data.items() if exp <= now]:
+                    del self._data[k]
+                if len(self._data) >= self.maxsize:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (now + self.ttl, value)
+
+    def pop(self, key: K) -> None:
+        """항목 제거 (없으면 무시)"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[K, V], bool]) -> None:
+        """조건(키, 값)에 맞는 항목을 모두 제거"""
+        with self._lock:
+            for k in [k for k, (_, v) in self._data.items() if predicate(k, v)]:
+                del self._data[k]
+
+    def clear(self) -> None:
+        """전체 항목 제거"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -5,6 +5,7 @@ MCP (Model Context Protocol) Client
 
 import asyncio
 import json
+import re
 import uuid
 import webbrowser
 from dataclasses import dataclass
@@ -32,6 +33,9 @@ from src.schemas.raih_exceptions import (
     RAIHBusinessException,
 )
 
+# SSE 응답의 첫 번째 data 라인 (전체 응답을 줄 단위로 나누지 않고 바로 탐색)
+_SSE_DATA_LINE_RE = re.compile(r"^[ \t]*data: (.*)$", re.MULTILINE)
+
 
 @dataclass
 class MCPTool:
@@ -126,22 +130,22 @@ class MCPClient:
 
     def _parse_sse_response(self, response_text: str) -> Dict[str, Any]:
         """SSE 형식 응답을 파싱하여 JSON 객체 반환"""
-        lines = response_text.strip().split("\n")
-        data_lines = [line[6:] for line in lines if line.strip().startswith("data: ")]
+        match = _SSE_DATA_LINE_RE.search(response_text)
 
-        if not data_lines:
+        if match is None:
             ClientLogger.error(
                 "SSE 응답에서 data를 찾을 수 없습니다",
                 response_length=len(response_text),
             )
             raise Exception("SSE 응답에서 data를 찾을 수 없습니다")
 
+        data = match.group(1)
         try:
-            result = json.loads(data_lines[0])
+            result = json.loads(data)
             ClientLogger.debug("SSE JSON 파싱 성공")
             return result
         except json.JSONDecodeError as e:
-            ClientLogger.error("SSE JSON 파싱 실패", error=str(e), data=data_lines[0])
+            ClientLogger.error("SSE JSON 파싱 실패", error=str(e), data=data)
             raise Exception(f"SSE data JSON 파싱 실패: {e}")
 
     def _build_request_payload(
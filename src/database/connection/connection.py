@@ -139,17 +139,19 @@ _lgenie_SessionLocal: sessionmaker = None
 
 
 def get_engine() -> Engine:
-    """데이터베이스 엔진 가져오기"""
+    """데이터베이스 엔진 가져오기 (프로세스 전체에서 하나의 엔진/연결 풀 공유)"""
     global _engine
-    _engine = create_database_engine("main", log_initialization=False)
+    if _engine is None:
+        _engine = create_database_engine("main", log_initialization=False)
     return _engine
 
 
 def get_session_local() -> sessionmaker:
     """세션 팩토리 가져오기"""
     global _SessionLocal
-    engine = get_engine()
-    _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    if _SessionLocal is None:
+        engine = get_engine()
+        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     return _SessionLocal
 
 
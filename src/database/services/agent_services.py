@@ -8,7 +8,9 @@ from datetime import datetime
 from logging import getLogger
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import func
+from sqlalchemy import bindparam, case, func, lambda_stmt, literal, or_, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -17,6 +19,29 @@ from .base_orm_service import ORMService
 
 logger = getLogger("database")
 
+# 사용자 활성 에이전트 조회 구문 (요청마다 구문 생성/컴파일을 피하기 위해 모듈 로드 시 1회 구성)
+_USER_ACTIVE_AGENTS_STMT = lambda_stmt(
+    lambda: select(
+        Agent.id,
+        Agent.name,
+        Agent.code,
+        Agent.description,
+        Agent.description_en,
+        Agent.created_at,
+        Agent.updated_at,
+        Agent.is_active,
+    )
+    .join(UserAgentMembership, UserAgentMembership.agent_id == Agent.id)
+    .where(
+        UserAgentMembership.user_id == bindparam("uid"),
+        UserAgentMembership.enabled == True,
+        Agent.is_active == True,
+    )
+)
+_USER_ACTIVE_AGENTS_BY_CODE_STMT = _USER_ACTIVE_AGENTS_STMT + (
+    lambda s: s.where(func.upper(Agent.code) == bindparam("code"))
+)
+
 
 class AgentService(ORMService[Agent]):
     """에이전트 서비스"""
@@ -80,6 +105,72 @@ class UserAgentMembershipService(ORMService[UserAgentMembership]):
             logger.error(f"사용자 에이전트 멤버십 조회 실패: {e}")
             return []
 
+    def has_enabled_memberships(self, db: Session, user_id: int) -> bool:
+        """사용자에게 활성 멤버십이 하나라도 있는지 확인 (LIMIT 1 존재 여부 조회)"""
+        try:
+            stmt = (
+                select(UserAgentMembership.agent_id)
+                .where(
+                    UserAgentMembership.user_id == user_id,
+                    UserAgentMembership.enabled == True,
+                )
+                .limit(1)
+            )
+            return db.execute(stmt).first() is not None
+        except SQLAlchemyError as e:
+            logger.error(f"사용자 활성 멤버십 존재 여부 조회 실패: {e}")
+            return False
+
+    def get_user_active_agents(
+        self, db: Session, user_id: int, agent_code: Optional[str] = None
+    ) -> List[RowMapping]:
+        """
+        사용자가 접근 가능한 활성 에이전트 조회 (멤버십-에이전트 JOIN 단일 쿼리)
+
+        응답 구성에 필요한 컬럼만 Core select로 조회하여 ORM 객체 생성 없이 매핑으로 반환하며,
+        agent_code가 주어지면 대소문자 무시로 필터링
+        """
+        try:
+            if agent_code:
+                result = db.execute(
+                    _USER_ACTIVE_AGENTS_BY_CODE_STMT,
+                    {"uid": user_id, "code": agent_code.upper()},
+                )
+            else:
+                result = db.execute(_USER_ACTIVE_AGENTS_STMT, {"uid": user_id})
+            return result.mappings().all()
+        except SQLAlchemyError as e:
+            logger.error(f"사용자 활성 에이전트 조회 실패: {e}")
+            return []
+
+    def get_unavailable_membership_agents(
+        self, db: Session, user_id: int
+    ) -> List[RowMapping]:
+        """
+        활성 멤버십 중 에이전트가 없거나 비활성화된 항목 조회 (LEFT OUTER JOIN 단일 쿼리)
+
+        Returns:
+            agent_id, code, is_active 매핑 목록 (에이전트가 없으면 code/is_active는 None)
+        """
+        try:
+            stmt = (
+                select(
+                    UserAgentMembership.agent_id,
+                    Agent.code,
+                    Agent.is_active,
+                )
+                .outerjoin(Agent, Agent.id == UserAgentMembership.agent_id)
+                .where(
+                    UserAgentMembership.user_id == user_id,
+                    UserAgentMembership.enabled == True,
+                    or_(Agent.id.is_(None), Agent.is_active == False),
+                )
+            )
+            return db.execute(stmt).mappings().all()
+        except SQLAlchemyError as e:
+            logger.error(f"사용 불가 멤버십 에이전트 조회 실패: {e}")
+            return []
+
     def get_agent_users(self, db: Session, agent_id: int) -> List[UserAgentMembership]:
         """에이전트의 사용자 멤버십 조회"""
         try:
@@ -172,6 +263,40 @@ class UserAgentMembershipService(ORMService[UserAgentMembership]):
             return None
 
 
+    def bulk_create_default_memberships(self, db: Session, user_id: int) -> int:
+        """
+        모든 활성 에이전트에 대한 기본 멤버십을 단일 INSERT ... SELECT로 생성
+
+        없는 멤버십만 추가하며 (신규 CAIA(agent_id=1) 멤버십은 enabled=False),
+        이미 있는 멤버십은 역할/활성 여부/만료일을 포함해 전혀 변경하지 않음
+
+        Returns:
+            int: 영향받은 행 수 (실패 시 0)
+        """
+        try:
+            stmt = mysql_insert(UserAgentMembership).from_select(
+                ["user_id", "agent_id", "role", "enabled"],
+                select(
+                    literal(user_id),
+                    Agent.id,
+                    literal("member"),
+                    case((Agent.id == 1, False), else_=True),
+                ).where(Agent.is_active == True),
+            )
+            # 중복 키는 자기 자신으로 갱신하는 no-op 처리 (INSERT IGNORE와 달리 다른 오류는 숨기지 않음)
+            stmt = stmt.on_duplicate_key_update(user_id=stmt.inserted.user_id)
+            result = db.execute(stmt)
+            db.commit()
+            logger.info(
+                f"기본 멤버십 일괄 생성 완료: user_id={user_id}, rows={result.rowcount}"
+            )
+            return result.rowcount
+        except SQLAlchemyError as e:
+            logger.error(f"기본 멤버십 일괄 생성 실패: {e}")
+            db.rollback()
+            return 0
+
+
 class AgentMembershipService(ORMService[UserAgentMembership]):
     """에이전트 멤버십 서비스"""
 
@@ -8,8 +8,9 @@ import hashlib
 import secrets
 from datetime import datetime, timedelta
 from logging import getLogger
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy import select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -245,6 +246,106 @@ class APIKeyService(ORMService[APIKey]):
             logger.error(f"[API_KEY] API Key 목록 조회 중 오류: {e}")
             return []
 
+    def _version_stmt(self):
+        """
+        ETag 계산용 버전 조회 구문 (ORM 객체/관계 로드 없이 응답에 쓰이는 컬럼만 조회)
+
+        키마다 권한 Agent 코드별로 한 행씩 반환하므로 (LEFT OUTER JOIN) 같은 초에 일어난 변경이나
+        Agent 코드 변경도 결과에 반영됩니다.
+        """
+        from ..models import Agent, APIKeyAgentPermission
+
+        return (
+            select(
+                APIKey.id,
+                APIKey.name,
+                APIKey.is_active,
+                APIKey.expires_at,
+                APIKey.last_used_at,
+                APIKey.created_at,
+                APIKey.updated_at,
+                Agent.code,
+            )
+            .outerjoin(
+                APIKeyAgentPermission, APIKeyAgentPermission.api_key_id == APIKey.id
+            )
+            .outerjoin(Agent, Agent.id == APIKeyAgentPermission.agent_id)
+        )
+
+    def get_key_version(self, db: Session, key_id: int) -> Optional[list[tuple[Any, ...]]]:
+        """
+        ETag 계산용 API Key 버전 정보 조회 (응답 컬럼 + 권한 Agent 코드, 단일 쿼리)
+
+        Args:
+            db: 데이터베이스 세션
+            key_id: API Key ID
+
+        Returns:
+            list: 권한 Agent 코드별 행 목록, 없거나 실패 시 None
+        """
+        try:
+            from ..models import Agent
+
+            rows = db.execute(
+                self._version_stmt()
+                .where(APIKey.id == key_id)
+                .order_by(Agent.code)
+            ).all()
+            return [tuple(row) for row in rows] or None
+
+        except SQLAlchemyError as e:
+            logger.error(f"[API_KEY] API Key 버전 조회 실패: {e}")
+            return None
+
+    def get_list_version(
+        self,
+        db: Session,
+        include_inactive: bool = False,
+        agent_code: Optional[str] = None,
+    ) -> Optional[list[tuple[Any, ...]]]:
+        """
+        ETag 계산용 API Key 목록 버전 정보 조회 (list_keys와 동일한 필터, 단일 쿼리)
+
+        Args:
+            db: 데이터베이스 세션
+            include_inactive: 비활성화된 키 포함 여부
+            agent_code: 특정 Agent에 대한 권한이 있는 키만 조회 (None이면 전체)
+
+        Returns:
+            list: 키/권한 Agent 코드별 행 목록 (키가 없으면 빈 목록), 실패 시 None
+        """
+        try:
+            from ..models import Agent, APIKeyAgentPermission
+
+            stmt = self._version_stmt()
+
+            if not include_inactive:
+                stmt = stmt.where(APIKey.is_active == True)
+
+            # Agent 필터링 (list_keys와 동일하게 존재하는 agent인 경우에만 적용,
+            # 응답에는 키의 모든 권한이 포함되므로 JOIN 대신 키 ID로 필터링)
+            if agent_code:
+                agent_id = db.execute(
+                    select(Agent.id).where(Agent.code == agent_code)
+                ).scalar()
+                if agent_id:
+                    stmt = stmt.where(
+                        APIKey.id.in_(
+                            select(APIKeyAgentPermission.api_key_id).where(
+                                APIKeyAgentPermission.agent_id == agent_id
+                            )
+                        )
+                    )
+
+            rows = db.execute(
+                stmt.order_by(APIKey.created_at.desc(), APIKey.id, Agent.code)
+            ).all()
+            return [tuple(row) for row in rows]
+
+        except SQLAlchemyError as e:
+            logger.error(f"[API_KEY] API Key 목록 버전 조회 실패: {e}")
+            return None
+
     def add_agent_permission(
         self, db: Session, api_key_id: int, agent_code: str
     ) -> bool:
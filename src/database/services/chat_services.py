@@ -8,9 +8,9 @@ from datetime import datetime
 from logging import getLogger
 from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import asc, desc, func
+from sqlalchemy import and_, asc, desc, func, insert, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from ..models import ChatChannel, ChatChannelStatus, ChatMessage, MessageType
 from .base_orm_service import ORMService
@@ -19,6 +19,21 @@ from .lgenie_sync_service import lgenie_sync_service
 logger = getLogger("database")
 
 
+def _message_sort_key(msg: ChatMessage) -> tuple:
+    """
+    메시지 정렬 키: (discussion_order, created_at)
+
+    discussion_order로 정렬: -1(user) < 0(setup) < 1~N(script) < N+1(wrapup)
+    discussion_order가 없으면 큰 값으로 설정하여 뒤로 밀림
+    """
+    metadata = msg.message_metadata
+    if metadata and isinstance(metadata, dict):
+        discussion_order = metadata.get("discussion_order")
+        if discussion_order is not None and isinstance(discussion_order, int):
+            return (discussion_order, msg.created_at or datetime.min)
+    return (999999, msg.created_at or datetime.min)
+
+
 class ChatChannelService(ORMService[ChatChannel]):
     """채팅방 서비스"""
 
@@ -37,6 +52,45 @@ class ChatChannelService(ORMService[ChatChannel]):
             logger.error(f"세션 ID로 채팅방 조회 실패: {e}")
             return None
 
+    def get_by_session_id_with_messages(
+        self,
+        db: Session,
+        session_id: str,
+        message_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Tuple[Optional[ChatChannel], List[ChatMessage]]:
+        """
+        세션 ID로 채팅방과 메시지 목록을 한 번의 쿼리(LEFT JOIN)로 조회
+
+        메시지 정렬 기준(discussion_order)이 JSON 메타데이터에 있으므로
+        정렬과 페이지네이션은 get_channel_messages와 동일하게 조회 후 적용합니다.
+
+        Returns:
+            (채팅방 또는 None, 정렬/페이지네이션된 메시지 목록)
+        """
+        try:
+            message_filter = ChatMessage.is_deleted == False
+            if message_type:
+                message_filter = and_(
+                    message_filter, ChatMessage.message_type == message_type
+                )
+
+            channel = (
+                db.query(ChatChannel)
+                .options(joinedload(ChatChannel.messages.and_(message_filter)))
+                .filter(ChatChannel.session_id == session_id)
+                .first()
+            )
+            if not channel:
+                return None, []
+
+            sorted_messages = sorted(channel.messages, key=_message_sort_key)
+            return channel, sorted_messages[offset : offset + limit]
+        except SQLAlchemyError as e:
+            logger.error(f"세션 ID로 채팅방/메시지 조회 실패: {e}")
+            return None, []
+
     def get_by_session_id_from_lgenie(self, session_id: str) -> bool:
         """LGenie DB에서 세션 ID로 채팅방 조회"""
         try:
@@ -180,21 +234,7 @@ class ChatMessageService(ORMService[ChatMessage]):
             # 모든 메시지를 가져온 후 discussion_order로 정렬
             messages = query.all()
 
-            # discussion_order로 정렬: -1(user) < 0(setup) < 1~N(script) < N+1(wrapup)
-            # discussion_order가 없으면 큰 값으로 설정하여 뒤로 밀림
-            def get_sort_key(msg: ChatMessage) -> tuple:
-                """정렬 키 생성: (discussion_order가 있으면 그것, 없으면 큰 값), created_at"""
-                metadata = msg.message_metadata
-                if metadata and isinstance(metadata, dict):
-                    discussion_order = metadata.get("discussion_order")
-                    if discussion_order is not None and isinstance(
-                        discussion_order, int
-                    ):
-                        return (discussion_order, msg.created_at or datetime.min)
-                # discussion_order가 없으면 큰 값으로 설정하여 뒤로 밀림
-                return (999999, msg.created_at or datetime.min)
-
-            sorted_messages = sorted(messages, key=get_sort_key)
+            sorted_messages = sorted(messages, key=_message_sort_key)
 
             # 페이지네이션 적용
             return sorted_messages[offset : offset + limit]
@@ -221,6 +261,43 @@ class ChatMessageService(ORMService[ChatMessage]):
             logger.error(f"최근 메시지 조회 실패: {e}")
             return []
 
+    def get_latest_discussion_setup(
+        self, db: Session, channel_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        채팅방의 가장 최근 토론 설정(topic, speakers가 있는 message_metadata) 조회
+
+        Returns:
+            토론 설정 메시지의 message_metadata 또는 없으면 None
+        """
+        try:
+            metadata = (
+                db.query(ChatMessage.message_metadata)
+                .filter(
+                    ChatMessage.channel_id == channel_id,
+                    ChatMessage.is_deleted == False,
+                    func.json_extract(ChatMessage.message_metadata, "$.topic").isnot(
+                        None
+                    ),
+                    func.json_extract(
+                        ChatMessage.message_metadata, "$.speakers"
+                    ).isnot(None),
+                )
+                .order_by(desc(ChatMessage.created_at))
+                .limit(1)
+                .scalar()
+            )
+            if (
+                isinstance(metadata, dict)
+                and metadata.get("topic")
+                and metadata.get("speakers")
+            ):
+                return metadata
+            return None
+        except SQLAlchemyError as e:
+            logger.error(f"최근 토론 설정 조회 실패: {e}")
+            return None
+
     def get_message_thread(
         self, db: Session, parent_message_id: int
     ) -> List[ChatMessage]:
@@ -235,21 +312,7 @@ class ChatMessageService(ORMService[ChatMessage]):
                 .all()
             )
 
-            # discussion_order로 정렬: -1(user) < 0(setup) < 1~N(script) < N+1(wrapup)
-            # discussion_order가 없으면 큰 값으로 설정하여 뒤로 밀림
-            def get_sort_key(msg: ChatMessage) -> tuple:
-                """정렬 키 생성: (discussion_order가 있으면 그것, 없으면 큰 값), created_at"""
-                metadata = msg.message_metadata
-                if metadata and isinstance(metadata, dict):
-                    discussion_order = metadata.get("discussion_order")
-                    if discussion_order is not None and isinstance(
-                        discussion_order, int
-                    ):
-                        return (discussion_order, msg.created_at or datetime.min)
-                # discussion_order가 없으면 큰 값으로 설정하여 뒤로 밀림
-                return (999999, msg.created_at or datetime.min)
-
-            return sorted(messages, key=get_sort_key)
+            return sorted(messages, key=_message_sort_key)
         except SQLAlchemyError as e:
             logger.error(f"메시지 스레드 조회 실패: {e}")
             return []
@@ -328,6 +391,36 @@ class ChatMessageService(ORMService[ChatMessage]):
             logger.error(f"채팅 메시지 생성 실패: {e}")
             return None
 
+    def create_and_touch_channel(
+        self, db: Session, channel_id: int, touch_last_message: bool = True, **kwargs
+    ) -> Optional[int]:
+        """
+        메시지 생성과 채팅방 마지막 메시지 시간 갱신을 한 트랜잭션으로 처리합니다.
+
+        ORM refresh 없이 INSERT/UPDATE 후 한 번만 커밋합니다.
+
+        Returns:
+            생성된 메시지 ID (실패 시 None)
+        """
+        try:
+            result = db.execute(
+                insert(ChatMessage).values(channel_id=channel_id, **kwargs)
+            )
+            message_id = result.inserted_primary_key[0]
+            if touch_last_message:
+                db.execute(
+                    update(ChatChannel)
+                    .where(ChatChannel.id == channel_id)
+                    .values(last_message_at=func.current_timestamp())
+                )
+            db.commit()
+            logger.info(f"ChatMessage 레코드가 생성되었습니다: {message_id}")
+            return message_id
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error(f"채팅 메시지 생성/채팅방 갱신 실패: {e}")
+            return None
+
     def save_discussion_script(
         self,
         db: Session,
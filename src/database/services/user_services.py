@@ -5,7 +5,7 @@ User 관련 서비스들
 """
 
 from logging import getLogger
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
@@ -54,6 +54,58 @@ class UserService(ORMService[User]):
             logger.error(f"활성 사용자 조회 실패: {e}")
             return []
 
+    def ensure_user_and_memberships(
+        self,
+        db: Session,
+        user_id: int,
+        new_user_fields: Optional[Dict[str, Any]] = None,
+    ) -> Optional[int]:
+        """
+        사용자를 등록(없는 경우)하고 모든 활성 에이전트에 대한 기본 멤버십 생성
+
+        Args:
+            db: 데이터베이스 세션
+            user_id: 사용자 DB ID
+            new_user_fields: 사용자가 없을 때 생성할 User 필드 (None이면 생성하지 않음)
+
+        Returns:
+            int: 멤버십이 등록된 사용자 DB ID (사용자를 찾거나 생성할 수 없으면 None)
+        """
+        from .agent_services import membership_service
+
+        # 사용자 확인 및 생성
+        user = self.get_by_id(db, user_id)
+        if not user and new_user_fields:
+            logger.info(
+                f"사용자 ID {user_id}를 찾을 수 없습니다. "
+                f"사용자 등록이 필요합니다. user_id={new_user_fields.get('user_id')}"
+            )
+            try:
+                user = User(**new_user_fields, use_yn=True)
+                db.add(user)
+                db.commit()
+                db.refresh(user)
+                logger.info(f"새 사용자 생성 완료: db_user_id={user.id}")
+            except SQLAlchemyError as e:
+                db.rollback()
+                logger.error(f"사용자 생성 실패: {e}")
+                user = None
+
+        if not user:
+            logger.error(
+                "사용자를 찾을 수 없거나 생성할 수 없어 멤버십을 생성할 수 없습니다."
+            )
+            return None
+
+        # 모든 활성 에이전트에 대한 멤버십 일괄 생성
+        created_count = membership_service.bulk_create_default_memberships(
+            db, user.id
+        )
+        logger.info(
+            f"사용자 {user.id}에게 활성 agent 멤버십 일괄 등록 완료 (rows={created_count})"
+        )
+        return user.id
+
 
 # 서비스 인스턴스
 user_service = UserService()
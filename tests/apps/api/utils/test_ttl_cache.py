@@ -0,0 +1,49 @@
+"""TTLCache 동작 테스트"""
+
+from src.apps.api.utils import ttl_cache
+from src.apps.api.utils.ttl_cache import TTLCache
+
+
+def test_get_returns_value_until_expired(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(ttl=10.0, maxsize=4)
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    now[0] = 110.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_set_evicts_expired_then_oldest_when_full(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(ttl=10.0, maxsize=2)
+
+    cache.set("old", 1)
+    now[0] = 5.0
+    cache.set("mid", 2)
+    now[0] = 12.0
+    cache.set("new", 3)
+    assert cache.get("old") is None
+    assert cache.get("mid") == 2
+
+    cache.set("newest", 4)
+    assert cache.get("mid") is None
+    assert cache.get("new") == 3
+    assert cache.get("newest") == 4
+
+
+def test_pop_where_removes_matching_keys():
+    cache: TTLCache[tuple, str] = TTLCache(ttl=60.0, maxsize=8)
+    cache.set((1, "x"), "a")
+    cache.set((1, "y"), "b")
+    cache.set((2, "x"), "c")
+
+    cache.pop_where(lambda key, _: key[0] == 1)
+
+    assert cache.get((1, "x")) is None
+    assert cache.get((1, "y")) is None
+    assert cache.get((2, "x")) == "c"
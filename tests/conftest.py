@@ -0,0 +1,10 @@
+"""
+테스트 공통 설정
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가 (src 패키지 import용)
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
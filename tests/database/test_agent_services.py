@@ -0,0 +1,55 @@
+"""
+기본 멤버십 일괄 생성 테스트
+
+이미 있는 멤버십(비활성화된 CAIA 등)이 bootstrap 과정에서 다시 활성화되지 않는지 확인
+"""
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy.dialects import mysql  # noqa: E402
+
+from src.database.services.agent_services import membership_service  # noqa: E402
+
+
+class _RecordingSession:
+    """실행된 구문만 기록하는 세션 대역"""
+
+    def __init__(self):
+        self.statements = []
+        self.committed = False
+
+    def execute(self, stmt, *args, **kwargs):
+        self.statements.append(stmt)
+
+        class _Result:
+            rowcount = 0
+
+        return _Result()
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=mysql.dialect()))
+
+
+def test_bulk_create_default_memberships_does_not_update_existing_rows():
+    db = _RecordingSession()
+
+    membership_service.bulk_create_default_memberships(db, user_id=42)
+
+    assert db.committed
+    assert len(db.statements) == 1
+    sql = _compile(db.statements[0])
+    on_duplicate = sql.split("ON DUPLICATE KEY UPDATE", 1)[1]
+    # 중복 키(기존 멤버십)는 user_id를 자기 값으로 두는 no-op만 수행
+    assert on_duplicate.strip() == "user_id = VALUES(user_id)"
+    # 비활성화된 멤버십이 다시 활성화되거나 역할/만료일이 초기화되지 않음
+    for column in ("enabled", "role", "expires_at"):
+        assert column not in on_duplicate